@@ -0,0 +1,96 @@
+"""Benchmark de inicialização do dashboard.
+
+Mede, cada etapa em um interpretador novo (como um worker recém-criado do Streamlit):
+
+- import_painel: tempo de `import campanhas.painel`, que não deve importar o plotly.express
+  (o Streamlit já traz o plotly.graph_objects; o express só entra ao construir um gráfico);
+- primeira_execucao: primeira execução completa do app.py (aba inicial, via AppTest);
+- reexecucao: execução seguinte na mesma sessão, já com os caches quentes.
+
+Uso:
+    python benchmark.py [--repeticoes N]
+
+Sai com código 1 se alguma mediana passar da meta em METAS.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent
+
+# Metas de tempo (segundos, mediana das repetições)
+METAS = {
+    "import_painel": 1.5,
+    "primeira_execucao": 3.0,
+    "reexecucao": 1.0,
+}
+
+_MEDIR_IMPORT = """
+import json, sys, time
+inicio = time.perf_counter()
+import campanhas.painel
+print(json.dumps({
+    "import_painel": time.perf_counter() - inicio,
+    "plotly_importado": "plotly.express" in sys.modules,
+}))
+"""
+
+_MEDIR_APP = """
+import json, time
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file({app!r}, default_timeout=120)
+inicio = time.perf_counter()
+app.run()
+primeira = time.perf_counter() - inicio
+assert not app.exception, [e.value for e in app.exception]
+inicio = time.perf_counter()
+app.run()
+print(json.dumps({{"primeira_execucao": primeira, "reexecucao": time.perf_counter() - inicio}}))
+"""
+
+
+def _executar(codigo):
+    """Roda o código em um interpretador novo e devolve o JSON da última linha impressa."""
+    resultado = subprocess.run(
+        [sys.executable, "-c", codigo], cwd=RAIZ, capture_output=True, text=True, check=True
+    )
+    return json.loads(resultado.stdout.strip().splitlines()[-1])
+
+
+def medir(repeticoes=3, app="app.py"):
+    """Mediana de cada medida ao longo das repetições, mais a indicação de plotly.express importado cedo demais."""
+    amostras = {nome: [] for nome in METAS}
+    plotly_importado = False
+    for _ in range(repeticoes):
+        medida = _executar(_MEDIR_IMPORT)
+        amostras["import_painel"].append(medida["import_painel"])
+        plotly_importado |= medida["plotly_importado"]
+
+        medida = _executar(_MEDIR_APP.format(app=str(RAIZ / app)))
+        amostras["primeira_execucao"].append(medida["primeira_execucao"])
+        amostras["reexecucao"].append(medida["reexecucao"])
+    return {nome: statistics.median(valores) for nome, valores in amostras.items()}, plotly_importado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--app", default="app.py")
+    args = parser.parse_args()
+
+    medianas, plotly_importado = medir(args.repeticoes, args.app)
+    falhou = plotly_importado
+    for nome, valor in medianas.items():
+        status = "ok" if valor <= METAS[nome] else "ACIMA DA META"
+        falhou |= valor > METAS[nome]
+        print(f"{nome:<20} {valor:6.3f}s  (meta {METAS[nome]:.1f}s)  {status}")
+    if plotly_importado:
+        print("plotly.express foi importado junto com campanhas.painel: o import sob demanda regrediu")
+    sys.exit(1 if falhou else 0)
+
+
+if __name__ == "__main__":
+    main()
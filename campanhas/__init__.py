@@ -0,0 +1,12 @@
+"""Código compartilhado pelos dashboards de campanhas (app.py e app0.py).
+
+- dados: leitura, limpeza e validação dos exports do Google Ads
+- metricas / estatisticas: métricas derivadas e intervalos de confiança
+- demografia: cubo demográfico (sexo x idade x período x campanha) e seus recortes
+- graficos: construção das figuras Plotly
+- insights: texto dos insights e recomendações
+- alertas: regras de limite de KPI (CPA, aumento de custo) para o job de alertas
+- exportacao: tabelas limpas e agregados em CSV, Parquet ou Excel
+- historico: histórico de palavras-chave entre períodos (trajetórias e CTR em queda)
+- painel: seções Streamlit montadas sobre o cache compartilhado
+"""
@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+
+from campanhas.metricas import preparar_secao
+
+# --- Alertas de KPI ---
+# Regras de limite avaliadas sobre as mesmas tabelas do dashboard (seções 1 e 6), sem
+# Streamlit: as campanhas de todas as contas são empilhadas e cada regra é uma única
+# comparação vetorizada sobre a tabela inteira.
+
+CPA_MAXIMO = 20.0       # R$ por conversão
+AUMENTO_CUSTO = 50.0    # % em relação ao período de comparação
+
+COLUNAS_ALERTA = ['Conta', 'Campanha', 'Regra', 'Valor', 'Limite', 'Confirmado', 'Mensagem']
+
+
+def _empilhar(contas, secao, tabela):
+    """Tabela de uma seção para todas as contas, com a coluna 'Conta'. Contas sem a seção são omitidas."""
+    partes = []
+    for conta, data in contas.items():
+        tabelas = preparar_secao(data, secao)
+        if tabelas:
+            partes.append(tabelas[tabela].assign(Conta=conta))
+    return pd.concat(partes, ignore_index=True) if partes else None
+
+
+def alertas_cpa(df_campanhas, cpa_maximo=CPA_MAXIMO, metas_cpa=None):
+    """Campanhas com CPA acima da meta (meta da campanha em `metas_cpa`, senão `cpa_maximo`).
+
+    Campanha com custo e sem conversões conta como CPA infinito. 'Confirmado' indica
+    que até o limite inferior do IC 95% do CPA está acima da meta. Campanhas com custo
+    ou conversões em branco no export (a validação só avisa) não têm CPA avaliado:
+    saem na regra "dados_invalidos", nunca como CPA infinito.
+    """
+    limite = df_campanhas['Nome da campanha'].map(metas_cpa or {}).fillna(cpa_maximo).to_numpy(dtype=float)
+    custo = df_campanhas['Custo'].to_numpy(dtype=float)
+    conversoes = df_campanhas['Conversões'].to_numpy(dtype=float)
+    invalido = np.isnan(custo) | np.isnan(conversoes)
+    cpa = np.where(conversoes > 0, df_campanhas['CPA_Calc'], np.where(custo > 0, np.inf, 0.0))
+    acima = ~invalido & (cpa > limite)
+
+    df = df_campanhas[acima]
+    valor = cpa[acima]
+    df_invalido = df_campanhas[invalido]
+    return pd.concat([
+        pd.DataFrame({
+            'Conta': df['Conta'].to_numpy(),
+            'Campanha': df['Nome da campanha'].to_numpy(),
+            'Regra': "cpa_acima_da_meta",
+            'Valor': valor,
+            'Limite': limite[acima],
+            'Confirmado': (df['CPA_IC_Inf'].to_numpy(dtype=float) > limite[acima]) | np.isinf(valor),
+            'Mensagem': [
+                f"CPA de R$ {v:,.2f} acima da meta de R$ {m:,.2f}" if np.isfinite(v)
+                else f"R$ {c:,.2f} gastos sem conversões (meta de CPA: R$ {m:,.2f})"
+                for v, m, c in zip(valor, limite[acima], custo[acima])
+            ],
+        }),
+        pd.DataFrame({
+            'Conta': df_invalido['Conta'].to_numpy(),
+            'Campanha': df_invalido['Nome da campanha'].to_numpy(),
+            'Regra': "dados_invalidos",
+            'Valor': np.nan,
+            'Limite': limite[invalido],
+            'Confirmado': False,
+            'Mensagem': "Custo ou conversões em branco no export: CPA não avaliado",
+        }),
+    ], ignore_index=True)
+
+
+def alertas_aumento_custo(df_alteracoes, aumento_custo=AUMENTO_CUSTO):
+    """Campanhas cujo custo subiu mais de `aumento_custo`% em relação ao período de comparação (seção 6)."""
+    acima = df_alteracoes['Custo_Percentual'].to_numpy(dtype=float) > aumento_custo
+    df = df_alteracoes[acima]
+    return pd.DataFrame({
+        'Conta': df['Conta'].to_numpy(),
+        'Campanha': df['Nome da campanha'].to_numpy(),
+        'Regra': "aumento_de_custo",
+        'Valor': df['Custo_Percentual'].to_numpy(dtype=float),
+        'Limite': aumento_custo,
+        'Confirmado': True,
+        'Mensagem': [
+            f"Custo subiu {p:.1f}% (R$ {a:,.2f} contra R$ {c:,.2f} no período de comparação)"
+            for p, a, c in zip(df['Custo_Percentual'], df['Custo'], df['Custo (Comparação)'])
+        ],
+    })
+
+
+def avaliar(contas, cpa_maximo=CPA_MAXIMO, aumento_custo=AUMENTO_CUSTO, metas_cpa=None):
+    """Alertas de todas as contas ({conta: data carregado}), uma linha por campanha e regra violada."""
+    alertas = []
+    df_campanhas = _empilhar(contas, "campanhas", "Campanhas")
+    if df_campanhas is not None:
+        alertas.append(alertas_cpa(df_campanhas, cpa_maximo, metas_cpa))
+    df_alteracoes = _empilhar(contas, "alteracoes", "Alteracoes")
+    if df_alteracoes is not None:
+        alertas.append(alertas_aumento_custo(df_alteracoes, aumento_custo))
+    if not alertas:
+        return pd.DataFrame(columns=COLUNAS_ALERTA)
+    return pd.concat(alertas, ignore_index=True)[COLUNAS_ALERTA]
@@ -0,0 +1,184 @@
+import hashlib
+import os
+import re
+from pathlib import Path
+
+import pandas as pd
+
+from campanhas import estatisticas, validacao
+from campanhas.estatisticas import adicionar_intervalos
+from campanhas.validacao import novo_problema, validar_colunas, validar_valores, validar_consistencia
+
+# --- Arquivos de Dados ---
+# Os exports do Google Ads ficam na raiz do repositório, ao lado dos dashboards;
+# CAMPANHAS_DADOS aponta para outra pasta (ex.: exports sintéticos do teste de carga)
+DIRETORIO_DADOS = Path(os.environ.get("CAMPANHAS_DADOS", Path(__file__).resolve().parent.parent))
+
+ARQUIVOS = {
+    "Campanhas": "Campanhas(2025.09.23-2025.10.22).csv",
+    "Dispositivos": "Dispositivos(2025.09.23-2025.10.22).csv",
+    "Redes": "Redes(2025.09.23-2025.10.22).csv",
+    "Dia": "Dia_e_hora(Dia_2025.09.23-2025.10.22).csv",
+    "Dia_Hora": "Dia_e_hora(Dia_Hora_2025.09.23-2025.10.22).csv",
+    "Hora": "Dia_e_hora(Hora_2025.09.23-2025.10.22).csv",
+    "Idade": "Informações_demográficas(Idade_2025.09.23-2025.10.22).csv",
+    "Sexo": "Informações_demográficas(Sexo_2025.09.23-2025.10.22).csv",
+    "Sexo_Idade": "Informações_demográficas(Sexo_Idade_2025.09.23-2025.10.22).csv",
+    "Alteracoes": "Maiores_alterações(2025.09.23-2025.10.22_em_comparação_com_2025.08.24-2025.09.22).csv",
+    "Palavras_Chave": "Palavras-chave_de_pesquisa(2025.09.23-2025.10.22).csv",
+}
+
+# Período (início-fim) no nome dos exports, ex.: "(Idade_2025.09.23-2025.10.22)"
+PERIODO_NO_NOME = re.compile(r"(\d{4}\.\d{2}\.\d{2})-(\d{4}\.\d{2}\.\d{2})")
+
+DAY_ORDER = ['Segunda-feira', 'Terça-feira', 'Quarta-feira', 'Quinta-feira', 'Sexta-feira', 'Sábado', 'Domingo']
+
+
+# --- Limpeza ---
+def clean_numeric_value(series):
+    """Limpa valores numéricos com separador de milhar/decimal e converte para float. Valores inválidos viram NaN."""
+    texto = series.astype(str).str.replace('.', '', regex=False).str.replace(',', '.', regex=False).str.strip()
+    return pd.to_numeric(texto.replace('', '0'), errors='coerce')
+
+
+def clean_currency_value(series):
+    """Limpa valores de moeda (R$) e converte para float."""
+    return clean_numeric_value(series.astype(str).str.replace('R$\xa0', '', regex=False))
+
+
+def clean_percent_value(series):
+    """Converte porcentagens como '3,82%' para float (3.82)."""
+    texto = series.astype(str).str.replace('%', '', regex=False).str.replace(',', '.', regex=False).str.strip()
+    return pd.to_numeric(texto.replace('', '0'), errors='coerce')
+
+
+def limpar(key, df):
+    """Aplica a limpeza específica de cada arquivo (in-place) e devolve o DataFrame."""
+    if key == "Campanhas":
+        df['Custo'] = clean_currency_value(df['Custo'])
+        df['Conversões'] = clean_numeric_value(df['Conversões'])
+        df['Custo / conv.'] = clean_currency_value(df['Custo / conv.'])
+
+    elif key == "Dispositivos":
+        df['Custo'] = clean_currency_value(df['Custo'])
+        df['Cliques'] = clean_numeric_value(df['Cliques'])
+        df['Conversões'] = clean_numeric_value(df['Conversões'])
+
+    elif key == "Redes":
+        df['Custo'] = clean_currency_value(df['Custo'])
+        df['Cliques'] = clean_numeric_value(df['Cliques'])
+
+    elif key == "Dia":
+        df['Impressões'] = clean_numeric_value(df['Impressões'])
+
+    elif key == "Hora":
+        df['Hora de início'] = pd.to_numeric(df['Hora de início'], errors='coerce')
+        df['Impressões'] = clean_numeric_value(df['Impressões'])
+
+    elif key == "Dia_Hora":
+        # Garantir que a hora é tratada como string de 2 dígitos
+        df['Hora de início'] = df['Hora de início'].astype(str).str.zfill(2)
+        df['Impressões'] = clean_numeric_value(df['Impressões'])
+
+    elif key in ["Idade", "Sexo", "Sexo_Idade"]:
+        df['Impressões'] = clean_numeric_value(df['Impressões'])
+        df['Porcentagem do total conhecido'] = clean_percent_value(df['Porcentagem do total conhecido'])
+
+    elif key == "Alteracoes":
+        for col in ['Custo', 'Custo (Comparação)']:
+            df[col] = clean_currency_value(df[col])
+        for col in ['Cliques', 'Cliques (Comparação)', 'Interações', 'Interações (Comparação)']:
+            df[col] = clean_numeric_value(df[col])
+
+    elif key == "Palavras_Chave":
+        df['Custo'] = clean_currency_value(df['Custo'])
+        df['Cliques'] = clean_numeric_value(df['Cliques'])
+        df['CTR'] = clean_percent_value(df['CTR'])
+
+    return df
+
+
+# --- Carregamento ---
+def ler_csv(caminho):
+    """Lê um export como texto; a limpeza converte cada coluna numérica.
+
+    Deixar o pandas inferir tipos transformava "1.250" em 1.25 (e depois em 125).
+    """
+    try:
+        return pd.read_csv(caminho, encoding='utf-8', dtype=str)
+    except UnicodeDecodeError:
+        return pd.read_csv(caminho, encoding='latin-1', dtype=str)
+
+
+def periodo_arquivo(key):
+    """Período de um export, lido do nome do arquivo (ex.: "2025.09.23-2025.10.22")."""
+    periodo = PERIODO_NO_NOME.search(ARQUIVOS[key])
+    return "-".join(periodo.groups()) if periodo else ""
+
+
+def _versao_carregamento():
+    # Hash do código que define os dados carregados (limpeza, validação, intervalos)
+    versao = hashlib.sha256()
+    for caminho in [__file__, validacao.__file__, estatisticas.__file__]:
+        versao.update(Path(caminho).read_bytes())
+    return versao.hexdigest()[:16]
+
+
+# Entra na chave do cache persistido em disco: uma versão nova do código não reaproveita
+# DataFrames limpos pela versão anterior (ex.: percentuais ainda como texto)
+VERSAO_CARREGAMENTO = _versao_carregamento()
+
+
+def assinatura_arquivos(diretorio=DIRETORIO_DADOS):
+    """Identifica a versão dos exports (nome, data de modificação e tamanho) para invalidar caches quando mudam."""
+    assinatura = []
+    for key, filename in ARQUIVOS.items():
+        caminho = Path(diretorio) / filename
+        try:
+            info = caminho.stat()
+            assinatura.append((key, info.st_mtime_ns, info.st_size))
+        except OSError:
+            assinatura.append((key, None, None))
+    return tuple(assinatura)
+
+
+def load_and_preprocess_data(diretorio=DIRETORIO_DADOS):
+    """Carrega todos os CSVs, aplica o pré-processamento de limpeza e valida cada arquivo.
+
+    Retorna (data, problemas). Arquivos que falham na validação ficam fora de `data`
+    e o motivo fica registrado em `problemas`, sem impedir o carregamento dos demais.
+    """
+    data = {}
+    problemas = []
+
+    for key, filename in ARQUIVOS.items():
+        try:
+            df = ler_csv(Path(diretorio) / filename)
+        except FileNotFoundError:
+            problemas.append(novo_problema(key, "erro", "arquivo", f"Arquivo não encontrado: {filename}. Certifique-se de que o nome do arquivo está correto e ele está no diretório de dados."))
+            continue
+        except Exception as e:
+            problemas.append(novo_problema(key, "erro", "arquivo", f"Erro ao ler o arquivo {filename}: {e}"))
+            continue
+
+        # Cabeçalho conferido antes da limpeza: sem as colunas esperadas o arquivo é descartado
+        problemas_arquivo = validar_colunas(key, df)
+        if problemas_arquivo:
+            problemas.extend(problemas_arquivo)
+            continue
+
+        limpar(key, df)
+
+        # Tipos e faixas conferidos depois da limpeza: erros descartam o arquivo, avisos não
+        problemas_arquivo = validar_valores(key, df)
+        problemas.extend(problemas_arquivo)
+        if any(problema['nivel'] == "erro" for problema in problemas_arquivo):
+            continue
+
+        data[key] = df
+
+    # Totais que deveriam bater entre arquivos (ex.: Custo em Campanhas, Dispositivos e Redes)
+    problemas.extend(validar_consistencia(data))
+
+    # Intervalos de confiança calculados uma única vez, junto com os dados em cache
+    return adicionar_intervalos(data), problemas
@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+
+# --- Cubo Demográfico ---
+# Impressões em um único array NumPy denso com os eixos sexo x faixa etária x período x
+# campanha. Totais, participações e recortes saem de somas e fatias nos eixos do cubo,
+# em vez de cada arquivo demográfico ser reordenado e plotado separadamente.
+
+EIXOS = ['Sexo', 'Faixa de idade', 'Período', 'Campanha']
+FAIXAS_ETARIAS = ['18 a 24', '25 a 34', '35 a 44', '45 a 54', '55 a 64', '+65']
+TODAS_CAMPANHAS = "Todas as campanhas"
+
+# Impressões cujo sexo ou idade o Google Ads não identificou ficam na última posição do
+# eixo correspondente, fora do "total conhecido" usado nas participações
+DESCONHECIDO = {'Sexo': "Desconhecido", 'Faixa de idade': "Desconhecida"}
+ROTULOS_DESCONHECIDOS = {"Desconhecido", "Desconhecida", "Indeterminado", "Indeterminada"}
+
+
+def _rotulos(valores, eixo):
+    """Categorias conhecidas de um eixo, na ordem de exibição."""
+    conhecidos = [v for v in pd.unique(valores) if v not in ROTULOS_DESCONHECIDOS]
+    if eixo == 'Faixa de idade':
+        conhecidos.sort(key=lambda v: FAIXAS_ETARIAS.index(v) if v in FAIXAS_ETARIAS else len(FAIXAS_ETARIAS))
+    return conhecidos
+
+
+def _codigos(df, eixos):
+    """Posição de cada linha em cada eixo do cubo (rótulos desconhecidos vão para a última posição)."""
+    codigos = []
+    for eixo, rotulos in eixos.items():
+        posicao = {rotulo: i for i, rotulo in enumerate(rotulos)}
+        desconhecido = len(rotulos) - 1
+        codigos.append(df[eixo].map(lambda v: posicao.get(v, desconhecido)).to_numpy())
+    return tuple(codigos)
+
+
+def _com_eixos(df, periodo, campanha):
+    # Os exports demográficos atuais são da conta inteira e de um único período
+    df = df.copy()
+    if 'Período' not in df:
+        df['Período'] = periodo
+    if 'Campanha' not in df:
+        df['Campanha'] = campanha
+    return df
+
+
+def construir_cubo(df_sexo_idade, df_sexo=None, df_idade=None, periodo="", campanha=TODAS_CAMPANHAS):
+    """Monta o cubo a partir do cruzamento Sexo x Idade (já limpo).
+
+    Os totais por sexo e por idade, quando informados, completam o cubo: a diferença
+    para o cruzamento (impressões em que só um dos dois é conhecido) entra na posição
+    "Desconhecido(a)" do outro eixo, de modo que os totais do cubo batem com cada arquivo.
+    Colunas 'Período' e 'Campanha' são opcionais; sem elas o cubo tem um único período/campanha.
+    """
+    cruzado = _com_eixos(df_sexo_idade, periodo, campanha)
+    marginais = [_com_eixos(df, periodo, campanha) for df in (df_sexo, df_idade) if df is not None]
+    todos = pd.concat([cruzado, *marginais], ignore_index=True)
+
+    eixos = {
+        'Sexo': _rotulos(todos['Sexo'].dropna(), 'Sexo') + [DESCONHECIDO['Sexo']],
+        'Faixa de idade': _rotulos(todos['Faixa de idade'].dropna(), 'Faixa de idade') + [DESCONHECIDO['Faixa de idade']],
+        'Período': list(pd.unique(todos['Período'])),
+        'Campanha': list(pd.unique(todos['Campanha'])),
+    }
+    valores = np.zeros([len(rotulos) for rotulos in eixos.values()])
+    np.add.at(valores, _codigos(cruzado, eixos), cruzado['Impressões'].to_numpy(dtype=float))
+
+    n_sexo, n_idade = len(eixos['Sexo']) - 1, len(eixos['Faixa de idade']) - 1
+    conhecido = valores[:n_sexo, :n_idade]
+    if df_sexo is not None:
+        df = _com_eixos(df_sexo, periodo, campanha).assign(**{'Faixa de idade': DESCONHECIDO['Faixa de idade']})
+        totais = np.zeros_like(valores)
+        np.add.at(totais, _codigos(df, eixos), df['Impressões'].to_numpy(dtype=float))
+        valores[:n_sexo, n_idade] = np.clip(totais[:n_sexo, n_idade] - conhecido.sum(axis=1), 0, None)
+    if df_idade is not None:
+        df = _com_eixos(df_idade, periodo, campanha).assign(Sexo=DESCONHECIDO['Sexo'])
+        totais = np.zeros_like(valores)
+        np.add.at(totais, _codigos(df, eixos), df['Impressões'].to_numpy(dtype=float))
+        valores[n_sexo, :n_idade] = np.clip(totais[n_sexo, :n_idade] - conhecido.sum(axis=0), 0, None)
+
+    return {"valores": valores, "eixos": eixos}
+
+
+def fatiar(cubo, filtros):
+    """Recorte do cubo, ex.: fatiar(cubo, {'Sexo': 'Feminino'}). Os eixos filtrados ficam com um único rótulo."""
+    indices = []
+    eixos = {}
+    for eixo, rotulos in cubo["eixos"].items():
+        if eixo in filtros:
+            i = rotulos.index(filtros[eixo])
+            indices.append(slice(i, i + 1))
+            eixos[eixo] = [filtros[eixo]]
+        else:
+            indices.append(slice(None))
+            eixos[eixo] = rotulos
+    return {"valores": cubo["valores"][tuple(indices)], "eixos": eixos}
+
+
+def marginal(cubo, eixos, incluir_desconhecidos=False):
+    """Impressões somadas nos demais eixos, com a participação (%) no total conhecido.
+
+    O total conhecido considera apenas as células em que todos os `eixos` pedidos são
+    conhecidos, como a coluna "Porcentagem do total conhecido" dos exports.
+    """
+    nomes = list(cubo["eixos"])
+    somar = tuple(i for i, eixo in enumerate(nomes) if eixo not in eixos)
+    totais = cubo["valores"].sum(axis=somar)
+
+    # Linhas na ordem dos eixos do cubo (pd.MultiIndex.from_product segue a ordem do array)
+    mantidos = [eixo for eixo in nomes if eixo in eixos]
+    indice = pd.MultiIndex.from_product([cubo["eixos"][eixo] for eixo in mantidos], names=mantidos)
+    df = pd.DataFrame({'Impressões': totais.ravel()}, index=indice).reset_index()
+
+    conhecido = np.ones(len(df), dtype=bool)
+    for eixo in mantidos:
+        if eixo in DESCONHECIDO:
+            conhecido &= (df[eixo] != DESCONHECIDO[eixo]).to_numpy()
+    total_conhecido = df.loc[conhecido, 'Impressões'].sum()
+    df['Participação'] = df['Impressões'] / total_conhecido * 100 if total_conhecido > 0 else 0.0
+    df.loc[~conhecido, 'Participação'] = np.nan
+    return (df if incluir_desconhecidos else df[conhecido]).reset_index(drop=True)[eixos + ['Impressões', 'Participação']]
+
+
+def cubo_para_tabela(cubo):
+    """Cubo em formato longo (uma linha por célula), para exportação."""
+    return marginal(cubo, EIXOS, incluir_desconhecidos=True)
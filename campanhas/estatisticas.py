@@ -0,0 +1,119 @@
+import numpy as np
+
+# --- Intervalos de Confiança ---
+# Todas as funções recebem arrays (uma posição por segmento) e calculam os
+# intervalos de todos os segmentos de uma só vez, sem laços em Python.
+
+Z_95 = 1.959963984540054
+
+
+def intervalo_wilson(sucessos, tentativas, z=Z_95):
+    """Intervalo de Wilson para proporções (CTR, taxa de conversão). Retorna (inferior, superior) em fração."""
+    k = np.asarray(sucessos, dtype=float)
+    n = np.asarray(tentativas, dtype=float)
+    validos = n > 0
+    n_seguro = np.where(validos, n, 1.0)
+    p = np.clip(k / n_seguro, 0.0, 1.0)
+
+    z2 = z * z
+    denominador = 1 + z2 / n_seguro
+    centro = (p + z2 / (2 * n_seguro)) / denominador
+    margem = z * np.sqrt(p * (1 - p) / n_seguro + z2 / (4 * n_seguro ** 2)) / denominador
+
+    inferior = np.where(validos, np.clip(centro - margem, 0.0, 1.0), np.nan)
+    superior = np.where(validos, np.clip(centro + margem, 0.0, 1.0), np.nan)
+    return inferior, superior
+
+
+def _quantil_gamma(forma, z):
+    """Quantil da Gamma(forma, 1) pela aproximação de Wilson–Hilferty (z = quantil da normal padrão)."""
+    base = 1 - 1 / (9 * forma) + z / (3 * np.sqrt(forma))
+    return forma * np.clip(base, 0.0, None) ** 3
+
+
+def intervalo_cpa(custo, conversoes, z=Z_95):
+    """Intervalo do CPA a partir da incerteza das conversões, vetorizado por segmento.
+
+    As conversões de cada segmento são tratadas como taxa de Poisson com priori de
+    Jeffreys (Gamma(conversões + 0,5)), o que mantém o limite superior finito mesmo
+    com 1 ou 2 conversões. Como o CPA é decrescente nas conversões, os limites do CPA
+    vêm direto dos quantis da Gamma, calculados em forma fechada: o intervalo de um
+    segmento depende só do seu custo e das suas conversões.
+    Segmentos sem conversões ficam com NaN.
+    """
+    custo = np.asarray(custo, dtype=float)
+    conversoes = np.asarray(conversoes, dtype=float)
+    forma = np.clip(conversoes, 0, None) + 0.5
+    conv_inf = _quantil_gamma(forma, -z)
+    conv_sup = _quantil_gamma(forma, z)
+
+    com_conversao = conversoes > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cpa_inf = np.where(com_conversao, custo / conv_sup, np.nan)
+        cpa_sup = np.where(com_conversao, custo / conv_inf, np.nan)
+    return cpa_inf, cpa_sup
+
+
+def intervalo_variacao_contagem(atual, comparacao, z=Z_95):
+    """Intervalo da variação percentual entre duas contagens (ex.: Cliques vs. Cliques (Comparação)).
+
+    Usa a aproximação log-normal da razão de taxas de Poisson. Retorna (inferior, superior) em %.
+    """
+    atual = np.asarray(atual, dtype=float)
+    comparacao = np.asarray(comparacao, dtype=float)
+    validos = (atual > 0) & (comparacao > 0)
+    a = np.where(validos, atual, 1.0)
+    c = np.where(validos, comparacao, 1.0)
+
+    log_razao = np.log(a / c)
+    erro_padrao = np.sqrt(1 / a + 1 / c)
+    inferior = np.where(validos, (np.exp(log_razao - z * erro_padrao) - 1) * 100, np.nan)
+    superior = np.where(validos, (np.exp(log_razao + z * erro_padrao) - 1) * 100, np.nan)
+    return inferior, superior
+
+
+def intervalos_sobrepostos(inf_a, sup_a, inf_b, sup_b):
+    """Indica se dois intervalos se sobrepõem (diferença não conclusiva). Valores NaN contam como sobreposição."""
+    if any(np.isnan(v) for v in (inf_a, sup_a, inf_b, sup_b)):
+        return True
+    return inf_a <= sup_b and inf_b <= sup_a
+
+
+def impressoes_estimadas(cliques, ctr):
+    """Impressões reconstruídas a partir de Cliques / CTR (%), que os relatórios de palavras-chave não trazem.
+
+    NaN quando o CTR é 0 (sem cliques não há como estimar).
+    """
+    cliques = np.asarray(cliques, dtype=float)
+    ctr = np.asarray(ctr, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(ctr > 0, np.round(cliques / (ctr / 100)), np.nan)
+
+
+def adicionar_intervalos(data):
+    """Acrescenta colunas de IC 95% (CPA, CTR, taxa de conversão e variações) aos DataFrames já limpos."""
+    if "Campanhas" in data:
+        df = data["Campanhas"]
+        df['CPA_IC_Inf'], df['CPA_IC_Sup'] = intervalo_cpa(df['Custo'], df['Conversões'])
+
+    if "Dispositivos" in data:
+        df = data["Dispositivos"]
+        df['CPA_IC_Inf'], df['CPA_IC_Sup'] = intervalo_cpa(df['Custo'], df['Conversões'])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            df['Taxa_Conversao'] = np.where(df['Cliques'] > 0, df['Conversões'] / df['Cliques'] * 100, np.nan)
+        inferior, superior = intervalo_wilson(df['Conversões'], df['Cliques'])
+        df['Taxa_Conversao_IC_Inf'], df['Taxa_Conversao_IC_Sup'] = inferior * 100, superior * 100
+
+    if "Palavras_Chave" in data:
+        df = data["Palavras_Chave"]
+        df['Impressões'] = impressoes_estimadas(df['Cliques'], df['CTR'])
+        inferior, superior = intervalo_wilson(df['Cliques'], df['Impressões'].fillna(0))
+        df['CTR_IC_Inf'], df['CTR_IC_Sup'] = inferior * 100, superior * 100
+
+    if "Alteracoes" in data:
+        df = data["Alteracoes"]
+        df['Cliques_Percentual_IC_Inf'], df['Cliques_Percentual_IC_Sup'] = intervalo_variacao_contagem(
+            df['Cliques'], df['Cliques (Comparação)']
+        )
+
+    return data
@@ -0,0 +1,83 @@
+import importlib.util
+import io
+import zipfile
+
+from campanhas.metricas import PREPARADORES, preparar_secao
+
+# --- Exportação dos Dados ---
+# Tabelas limpas e agregados do dashboard em CSV, Parquet ou Excel, para que as
+# análises em notebooks partam dos mesmos dados já tratados.
+
+# Formato -> (extensão, MIME, módulo opcional necessário)
+FORMATOS = {
+    "CSV": ("csv", "text/csv", None),
+    "Parquet": ("parquet", "application/vnd.apache.parquet", "pyarrow"),
+    "Excel": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", "openpyxl"),
+}
+
+# Agregado exportável -> (seção de campanhas.metricas, tabela gerada pela seção)
+AGREGADOS = {
+    "Metricas_Campanhas": ("campanhas", "Campanhas"),
+    "Metricas_Dispositivos": ("dispositivos", "Dispositivos"),
+    "Metricas_Palavras_Chave_Custo": ("palavras_chave", "KW_Custo"),
+    "Metricas_Palavras_Chave_CTR": ("palavras_chave", "KW_CTR"),
+    "Impressoes_Dia_x_Hora": ("temporal", "Mapa_Calor"),
+    "Demografia_Sexo_x_Idade": ("demografia", "Demografia"),
+    "Variacao_Periodos": ("alteracoes", "Alteracoes"),
+}
+
+
+def formatos_disponiveis():
+    """Formatos cujas bibliotecas opcionais (pyarrow, openpyxl) estão instaladas."""
+    return [
+        formato for formato, (_, _, modulo) in FORMATOS.items()
+        if modulo is None or importlib.util.find_spec(modulo) is not None
+    ]
+
+
+def nomes_tabelas(data):
+    """Nomes das tabelas exportáveis: os arquivos limpos carregados e os agregados das seções disponíveis."""
+    agregados = [
+        nome for nome, (secao, _) in AGREGADOS.items()
+        if all(chave in data for chave in PREPARADORES[secao][0])
+    ]
+    return list(data) + agregados
+
+
+def obter_tabela(data, nome):
+    """DataFrame de uma tabela exportável (limpa ou agregada)."""
+    if nome in data:
+        return data[nome]
+    secao, tabela = AGREGADOS[nome]
+    df = preparar_secao(data, secao)[tabela]
+    # O mapa de calor usa a hora como índice; na exportação ela vira coluna
+    return df.reset_index() if nome == "Impressoes_Dia_x_Hora" else df
+
+
+def serializar(df, formato):
+    """Converte um DataFrame para os bytes do arquivo no formato escolhido."""
+    if formato == "CSV":
+        # utf-8-sig: o Excel reconhece os acentos ao abrir o CSV diretamente
+        return df.to_csv(index=False).encode('utf-8-sig')
+    buffer = io.BytesIO()
+    if formato == "Parquet":
+        df.to_parquet(buffer, index=False)
+    elif formato == "Excel":
+        df.to_excel(buffer, index=False)
+    else:
+        raise ValueError(f"Formato de exportação desconhecido: {formato}")
+    return buffer.getvalue()
+
+
+def nome_arquivo(nome, formato):
+    """Nome do arquivo baixado, com a extensão do formato."""
+    return f"{nome}.{FORMATOS[formato][0]}"
+
+
+def empacotar(arquivos):
+    """Compacta {nome do arquivo: bytes} em um único .zip."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for nome, conteudo in arquivos.items():
+            zf.writestr(nome, conteudo)
+    return buffer.getvalue()
@@ -0,0 +1,258 @@
+import pandas as pd
+import plotly.express as px
+
+from campanhas.dados import DAY_ORDER
+
+# --- Construção dos Gráficos ---
+# Cada função recebe as tabelas já preparadas por campanhas.metricas e devolve a
+# figura Plotly; os dashboards só escolhem quais variantes exibir.
+
+
+# 1. Campanhas
+def fig_campanhas_dispersao(df_campanhas):
+    """Custo vs. Conversões por campanha, com o tamanho do ponto proporcional ao CPA."""
+    cpa_max = df_campanhas['CPA_Calc'].max()
+    # Substituir NaN (campanha sem conversão) por um valor alto para visualização
+    preenchimento = cpa_max * 1.5 if pd.notna(cpa_max) and cpa_max > 0 else 1
+    fig = px.scatter(
+        df_campanhas.fillna({'CPA_Calc': preenchimento}),
+        x='Custo',
+        y='Conversões',
+        size='CPA_Calc',
+        color='Nome da campanha',
+        hover_name='Nome da campanha',
+        log_x=True,
+        title="Custo vs. Conversões por Campanha (Tamanho = CPA)",
+        labels={'CPA_Calc': 'CPA (Custo/Conversão)'}
+    )
+    fig.update_layout(height=500)
+    return fig
+
+
+def fig_campanhas_cpa(df_campanhas):
+    """CPA por campanha em barras, com barras de erro do IC 95%."""
+    df = df_campanhas.sort_values(by='CPA_Calc', ascending=False, na_position='first')
+    df = df.assign(
+        CPA_Texto=df['CPA_Calc'].map(lambda x: f"R$ {x:,.2f}" if pd.notna(x) else "Sem Conversões"),
+        CPA_Erro_Sup=df['CPA_IC_Sup'] - df['CPA_Calc'],
+        CPA_Erro_Inf=df['CPA_Calc'] - df['CPA_IC_Inf']
+    )
+    fig = px.bar(
+        df,
+        x='Nome da campanha',
+        y='CPA_Calc',
+        color='CPA_Calc',
+        title="CPA (Custo por Conversão) por Campanha (Menor CPA = Melhor; Barras de erro = IC 95%)",
+        text='CPA_Texto',
+        error_y='CPA_Erro_Sup',
+        error_y_minus='CPA_Erro_Inf',
+        color_continuous_scale=px.colors.sequential.Viridis_r,  # Viridis_r: CPA baixo (bom) é cor mais forte
+        labels={'CPA_Calc': 'CPA (R$)', 'Nome da campanha': 'Campanha'}
+    )
+    fig.update_traces(textposition='outside')
+    fig.update_layout(
+        height=500,
+        xaxis={'categoryorder': 'array', 'categoryarray': df['Nome da campanha'].tolist()},
+        uniformtext_minsize=8,
+        uniformtext_mode='hide'
+    )
+    return fig
+
+
+# 2. Dispositivos
+def fig_custo_dispositivo(df_dispositivos):
+    """Distribuição do custo por dispositivo (dispositivos sem custo, como 'Telas de TV', ficam de fora)."""
+    return px.pie(
+        df_dispositivos[df_dispositivos['Custo'] > 0],
+        values='Custo',
+        names='Dispositivo',
+        title='Custo por Dispositivo',
+        hole=.3
+    )
+
+
+def fig_conversoes_dispositivo(df_dispositivos):
+    """Conversões por dispositivo, coloridas pelo CPA."""
+    return px.bar(
+        df_dispositivos.sort_values(by='Conversões', ascending=False),
+        x='Dispositivo',
+        y='Conversões',
+        color='CPA',
+        title='Conversões por Dispositivo (Cor = CPA)',
+        text='Conversões',
+        color_continuous_scale=px.colors.sequential.Inferno
+    )
+
+
+# 3. Temporal
+def fig_impressoes_dia(df_dia_ordenado):
+    """Impressões por dia da semana, de segunda a domingo."""
+    fig = px.bar(
+        df_dia_ordenado,
+        x='Dia',
+        y='Impressões',
+        title='Total de Impressões por Dia da Semana',
+        text='Impressões',
+        color='Impressões',
+        category_orders={"Dia": DAY_ORDER}
+    )
+    fig.update_traces(texttemplate='%{text:,.0f}', textposition='outside')
+    fig.update_layout(uniformtext_minsize=8, uniformtext_mode='hide')
+    return fig
+
+
+def fig_impressoes_hora(df_hora):
+    """Impressões por hora do dia."""
+    return px.line(
+        df_hora,
+        x='Hora de início',
+        y='Impressões',
+        title='Total de Impressões por Hora',
+        markers=True
+    )
+
+
+def fig_mapa_calor(mapa_calor):
+    """Mapa de calor de impressões (hora x dia da semana)."""
+    fig = px.imshow(
+        mapa_calor.values,
+        x=mapa_calor.columns,
+        y=mapa_calor.index,
+        color_continuous_scale='Reds',
+        aspect="auto",
+        labels=dict(x="Dia da Semana", y="Hora", color="Impressões")
+    )
+    fig.update_xaxes(side="top")
+    fig.update_layout(
+        title='Mapa de Calor de Impressões (Dia vs. Hora)',
+        height=600
+    )
+    return fig
+
+
+def fig_linhas_por_dia(df_dia_hora):
+    """Tendência horária de impressões, um gráfico de linhas por dia da semana."""
+    fig = px.line(
+        df_dia_hora,
+        x='Hora de início',
+        y='Impressões',
+        color='Dia',
+        line_group='Dia',
+        facet_col='Dia',
+        facet_col_wrap=4,
+        title='Tendência de Impressões por Hora, Detalhado por Dia da Semana',
+        category_orders={"Dia": DAY_ORDER, "Hora de início": sorted(df_dia_hora['Hora de início'].unique())},
+        labels={'Hora de início': 'Hora', 'Impressões': 'Impressões'}
+    )
+    fig.update_traces(mode='lines+markers')
+    # Limpar os títulos dos pequenos gráficos
+    fig.for_each_annotation(lambda a: a.update(text=a.text.split("=")[-1]))
+    # Permitir que os eixos Y sejam independentes para ver a forma do pico
+    fig.update_yaxes(matches=None, showticklabels=True)
+    fig.update_layout(height=800)
+    return fig
+
+
+# 4. Demografia
+def fig_impressoes_idade(df_idade, titulo='Impressões por Idade'):
+    """Impressões por faixa etária, coloridas pela participação (%) no total conhecido."""
+    fig = px.bar(
+        df_idade.sort_values(by='Impressões', ascending=False),
+        x='Faixa de idade',
+        y='Impressões',
+        title=titulo,
+        text='Participação',
+        color='Participação',
+        color_continuous_scale='Blues',
+        labels={'Participação': 'Participação (%)'}
+    )
+    fig.update_traces(texttemplate='%{text:.2f}%', textposition='outside')
+    return fig
+
+
+def fig_impressoes_sexo_idade(df_sexo_idade):
+    """Impressões por sexo e faixa etária, em barras agrupadas."""
+    return px.bar(
+        df_sexo_idade.sort_values(by='Impressões', ascending=False),
+        x='Faixa de idade',
+        y='Impressões',
+        color='Sexo',
+        title='Impressões por Sexo e Faixa Etária',
+        barmode='group',
+        hover_data={'Participação': ':.2f'},
+        labels={'Participação': 'Participação (%)'}
+    )
+
+
+# 5. Palavras-chave
+def fig_palavras_chave_custo(df_kw_top_custo, top_n):
+    """Top N palavras-chave por custo."""
+    fig = px.bar(
+        df_kw_top_custo,
+        x='Custo',
+        y='Palavra-chave da rede de pesquisa',
+        orientation='h',
+        title=f'Top {top_n} Palavras-chave por Custo',
+        text='Custo'
+    )
+    fig.update_traces(texttemplate='R$ %{text:.2f}', textposition='outside')
+    fig.update_layout(yaxis={'categoryorder': 'total ascending'}, height=600)
+    return fig
+
+
+def fig_palavras_chave_ctr(df_kw_top_ctr, top_n):
+    """Top N palavras-chave por CTR, com barras de erro do IC 95%."""
+    fig = px.bar(
+        df_kw_top_ctr,
+        x='CTR',
+        y='Palavra-chave da rede de pesquisa',
+        orientation='h',
+        title=f'Top {top_n} Palavras-chave por CTR (Barras de erro = IC 95%)',
+        text='CTR',
+        error_x='CTR_Erro_Sup',
+        error_x_minus='CTR_Erro_Inf'
+    )
+    fig.update_traces(texttemplate='%{text:.2f}%', textposition='outside')
+    fig.update_layout(yaxis={'categoryorder': 'total ascending'}, height=600)
+    return fig
+
+
+def fig_trajetoria_palavra_chave(df_trajetoria, titulo):
+    """CTR e custo de uma palavra-chave ao longo dos períodos do histórico."""
+    fig = px.line(
+        df_trajetoria,
+        x='Fim',
+        y=['CTR', 'Custo'],
+        markers=True,
+        facet_row='variable',
+        title=titulo,
+        labels={'Fim': 'Fim do Período', 'value': 'Valor', 'variable': 'Métrica'}
+    )
+    fig.update_yaxes(matches=None, showticklabels=True)
+    fig.for_each_annotation(lambda a: a.update(text=a.text.split("=")[-1]))
+    fig.update_layout(height=500, showlegend=False)
+    return fig
+
+
+# 6. Comparativo de períodos
+def fig_alteracoes(df_alteracoes):
+    """Variação % de custo por campanha, colorida pela variação % de cliques."""
+    fig = px.bar(
+        df_alteracoes,
+        x='Custo_Percentual',
+        y='Nome da campanha',
+        color='Cliques_Percentual',
+        title='Alteração Percentual de Custo (Cor = Alteração Percentual de Cliques)',
+        orientation='h',
+        color_continuous_scale=px.colors.diverging.RdYlGn,
+        hover_data={'Cliques_Percentual_IC_Inf': ':.1f', 'Cliques_Percentual_IC_Sup': ':.1f'},
+        labels={
+            'Custo_Percentual': 'Custo % de Mudança',
+            'Cliques_Percentual': 'Cliques % de Mudança',
+            'Cliques_Percentual_IC_Inf': 'Cliques % (IC 95% inf.)',
+            'Cliques_Percentual_IC_Sup': 'Cliques % (IC 95% sup.)'
+        }
+    )
+    fig.update_traces(texttemplate='%{x:.1f}%', textposition='outside')
+    fig.update_layout(yaxis={'categoryorder': 'total ascending'}, height=500)
+    return fig
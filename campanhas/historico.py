@@ -0,0 +1,207 @@
+import importlib.util
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from campanhas.dados import DIRETORIO_DADOS, PERIODO_NO_NOME, ler_csv, limpar
+from campanhas.estatisticas import impressoes_estimadas
+from campanhas.validacao import validar_colunas
+
+# --- Histórico de Palavras-chave ---
+# Cada export de palavras-chave é um retrato de um período. Aqui os retratos são
+# acumulados em uma tabela colunar (um registro por palavra-chave e período, só
+# acrescentada) e indexados por palavra-chave, para acompanhar a trajetória de CTR
+# e custo, o momento em que a palavra foi pausada e as que estão perdendo CTR.
+
+DIRETORIO_HISTORICO = DIRETORIO_DADOS / "historico"
+# Exports antigos podem ficar na raiz (junto do atual) ou em historico/exports
+PADRAO_EXPORT = "Palavras-chave_de_pesquisa(*).csv"
+
+COLUNAS_HISTORICO = ['Palavra-chave', 'Tipo de corresp.', 'Inicio', 'Fim', 'Status do critério', 'Custo', 'Cliques', 'Impressões', 'CTR']
+# Identificação de uma palavra-chave entre períodos
+CHAVE = ['Palavra-chave', 'Tipo de corresp.']
+
+# Decaimento de CTR: pelo menos MIN_PERIODOS retratos e queda relativa (tendência
+# linear entre o primeiro e o último período) de pelo menos QUEDA_MINIMA
+MIN_PERIODOS = 3
+QUEDA_MINIMA = 0.2
+
+
+def _arquivo_historico(diretorio):
+    # Parquet quando o pyarrow está instalado; senão CSV com os valores já limpos
+    extensao = "parquet" if importlib.util.find_spec("pyarrow") is not None else "csv"
+    return Path(diretorio) / f"palavras_chave.{extensao}"
+
+
+def ler_historico(diretorio=DIRETORIO_HISTORICO):
+    """Tabela histórica completa (vazia se ainda não existe)."""
+    caminho = _arquivo_historico(diretorio)
+    if not caminho.exists():
+        return pd.DataFrame(columns=COLUNAS_HISTORICO)
+    if caminho.suffix == ".parquet":
+        return pd.read_parquet(caminho)
+    return pd.read_csv(caminho, dtype={'Inicio': str, 'Fim': str})
+
+
+def _gravar_historico(historico, diretorio):
+    caminho = _arquivo_historico(diretorio)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    # Grava em um arquivo temporário exclusivo e troca: leitores nunca veem um arquivo
+    # pela metade, e dois processos gravando ao mesmo tempo não escrevem no mesmo temporário
+    with tempfile.NamedTemporaryFile(dir=caminho.parent, prefix=caminho.name, suffix=".tmp", delete=False) as arquivo:
+        temporario = Path(arquivo.name)
+    try:
+        if caminho.suffix == ".parquet":
+            historico.to_parquet(temporario, index=False)
+        else:
+            historico.to_csv(temporario, index=False)
+        os.replace(temporario, caminho)
+    finally:
+        temporario.unlink(missing_ok=True)
+
+
+def retrato(df_palavras_chave, inicio, fim):
+    """Converte um export de palavras-chave já limpo em registros do histórico para o período [inicio, fim]."""
+    cliques = df_palavras_chave['Cliques'].to_numpy(dtype=float)
+    ctr = df_palavras_chave['CTR'].to_numpy(dtype=float)
+    return pd.DataFrame({
+        'Palavra-chave': df_palavras_chave['Palavra-chave da rede de pesquisa'].to_numpy(),
+        'Tipo de corresp.': df_palavras_chave['Tipo de corresp.'].to_numpy() if 'Tipo de corresp.' in df_palavras_chave else "",
+        'Inicio': inicio,
+        'Fim': fim,
+        'Status do critério': df_palavras_chave['Status do critério'].to_numpy(),
+        'Custo': df_palavras_chave['Custo'].to_numpy(dtype=float),
+        'Cliques': cliques,
+        'Impressões': impressoes_estimadas(cliques, ctr),
+        'CTR': ctr,
+    })
+
+
+def exports_encontrados(diretorio_dados=DIRETORIO_DADOS, diretorio_historico=DIRETORIO_HISTORICO):
+    """Exports de palavras-chave disponíveis, como {(inicio, fim): caminho}, com o período lido do nome do arquivo."""
+    encontrados = {}
+    for diretorio in [Path(diretorio_historico) / "exports", Path(diretorio_dados)]:
+        for caminho in sorted(diretorio.glob(PADRAO_EXPORT)):
+            periodo = PERIODO_NO_NOME.search(caminho.name)
+            if periodo:
+                encontrados[periodo.groups()] = caminho
+    return encontrados
+
+
+def assinatura_historico(diretorio_dados=DIRETORIO_DADOS, diretorio_historico=DIRETORIO_HISTORICO):
+    """Versão dos exports de palavras-chave, para invalidar caches quando mudam.
+
+    A tabela histórica fica de fora: ela só muda quando um export novo é registrado, e
+    incluí-la faria o próprio registro invalidar o cache logo na execução seguinte.
+    """
+    assinatura = []
+    for caminho in exports_encontrados(diretorio_dados, diretorio_historico).values():
+        try:
+            info = caminho.stat()
+            assinatura.append((caminho.name, info.st_mtime_ns, info.st_size))
+        except OSError:
+            assinatura.append((caminho.name, None, None))
+    return tuple(assinatura)
+
+
+def atualizar_historico(diretorio_dados=DIRETORIO_DADOS, diretorio_historico=DIRETORIO_HISTORICO):
+    """Acrescenta ao histórico os exports de períodos ainda não registrados e devolve a tabela completa.
+
+    Períodos já presentes não são regravados (o histórico só cresce). Exports com
+    cabeçalho inválido são ignorados; a validação detalhada fica a cargo do dashboard.
+    """
+    historico = ler_historico(diretorio_historico)
+    registrados = set(zip(historico['Inicio'], historico['Fim']))
+
+    novos = []
+    for (inicio, fim), caminho in exports_encontrados(diretorio_dados, diretorio_historico).items():
+        if (inicio, fim) in registrados:
+            continue
+        df = ler_csv(caminho)
+        if validar_colunas("Palavras_Chave", df):
+            continue
+        novos.append(retrato(limpar("Palavras_Chave", df), inicio, fim))
+
+    if novos:
+        historico = pd.concat([historico, *novos], ignore_index=True)
+        _gravar_historico(historico, diretorio_historico)
+    return historico
+
+
+def construir_indice(historico):
+    """Índice do histórico: colunas como arrays NumPy ordenados por (palavra-chave, período) e
+    um dicionário palavra-chave -> (início, fim) das suas linhas.
+
+    Consultar uma palavra-chave é um acesso ao dicionário mais uma fatia dos arrays,
+    sem varrer o histórico, qualquer que seja o número de períodos acumulados.
+    """
+    ordenado = historico.sort_values(CHAVE + ['Fim'], kind='stable').reset_index(drop=True)
+    codigos, chaves = pd.factorize(pd.MultiIndex.from_frame(ordenado[CHAVE]), sort=False)
+    # Como o histórico está ordenado pela chave, cada palavra-chave ocupa um bloco contíguo
+    limites = np.flatnonzero(np.diff(codigos)) + 1
+    inicios = np.concatenate([[0], limites]) if len(codigos) else np.array([], dtype=int)
+    fins = np.concatenate([limites, [len(codigos)]]) if len(codigos) else np.array([], dtype=int)
+
+    return {
+        "colunas": {col: ordenado[col].to_numpy() for col in COLUNAS_HISTORICO},
+        "codigos": codigos,
+        "posicoes": {chave: (int(i), int(f)) for chave, i, f in zip(chaves, inicios, fins)},
+    }
+
+
+def trajetoria(indice, chave):
+    """Histórico de uma palavra-chave (tupla palavra, tipo de correspondência), em ordem de período."""
+    inicio, fim = indice["posicoes"][chave]
+    return pd.DataFrame({col: valores[inicio:fim] for col, valores in indice["colunas"].items()})
+
+
+def primeira_pausa(indice, chave):
+    """Fim do primeiro período em que a palavra-chave aparece pausada, ou None."""
+    inicio, fim = indice["posicoes"][chave]
+    status = indice["colunas"]['Status do critério'][inicio:fim]
+    pausado = np.flatnonzero(pd.Series(status).str.startswith('Pausad').to_numpy())
+    return indice["colunas"]['Fim'][inicio + pausado[0]] if len(pausado) else None
+
+
+def detectar_decaimento_ctr(indice, min_periodos=MIN_PERIODOS, queda_minima=QUEDA_MINIMA):
+    """Palavras-chave cujo CTR cai ao longo dos períodos, calculado para todas de uma vez.
+
+    Para cada palavra-chave ajusta uma reta CTR x (ordem do período) por mínimos
+    quadrados, com somas agrupadas via np.bincount. A queda relativa é a variação da
+    reta entre o primeiro e o último período dividida pelo CTR médio.
+    """
+    codigos = indice["codigos"]
+    n_chaves = len(indice["posicoes"])
+    if n_chaves == 0:
+        return pd.DataFrame(columns=CHAVE + ['Periodos', 'CTR_Inicial', 'CTR_Final', 'Queda_Relativa'])
+
+    ctr = indice["colunas"]['CTR'].astype(float)
+    validos = ~np.isnan(ctr)
+    # Ordem do período dentro de cada palavra-chave (0, 1, 2, ...)
+    inicios = np.array([inicio for inicio, _ in indice["posicoes"].values()])
+    x = np.arange(len(codigos)) - inicios[codigos]
+
+    c, xv, yv = codigos[validos], x[validos].astype(float), ctr[validos]
+    n = np.bincount(c, minlength=n_chaves)
+    soma_x = np.bincount(c, xv, n_chaves)
+    soma_y = np.bincount(c, yv, n_chaves)
+    soma_xy = np.bincount(c, xv * yv, n_chaves)
+    soma_xx = np.bincount(c, xv * xv, n_chaves)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        inclinacao = (n * soma_xy - soma_x * soma_y) / (n * soma_xx - soma_x ** 2)
+        media = soma_y / n
+        extensao = np.bincount(codigos, minlength=n_chaves) - 1
+        queda_relativa = -inclinacao * extensao / media
+
+    fins = np.array([fim for _, fim in indice["posicoes"].values()])
+    resultado = pd.DataFrame(list(indice["posicoes"]), columns=CHAVE)
+    resultado['Periodos'] = n
+    resultado['CTR_Inicial'] = ctr[inicios]
+    resultado['CTR_Final'] = ctr[fins - 1]
+    resultado['Queda_Relativa'] = queda_relativa
+    decaindo = (n >= min_periodos) & (media > 0) & (queda_relativa >= queda_minima)
+    return resultado[decaindo].sort_values('Queda_Relativa', ascending=False).reset_index(drop=True)
@@ -0,0 +1,157 @@
+from campanhas import demografia
+from campanhas.estatisticas import intervalos_sobrepostos
+
+# --- Insights e Recomendações ---
+# Texto usado pelos dois dashboards. Cada insight depende apenas dos arquivos da
+# sua seção; se algum arquivo não passou na validação, o insight é omitido.
+
+# Como cada dashboard se refere ao gráfico de detalhe temporal que exibe
+REFERENCIAS_TEMPORAIS = {
+    "mapa_calor": "O mapa de calor mostra um alto volume de impressões",
+    "linhas": "A **Análise Detalhada** (gráfico de linhas facetado) confirma que os picos ocorrem",
+}
+
+
+def _insight_dispositivos(df_dispositivos):
+    smartphone_row = df_dispositivos[df_dispositivos['Dispositivo'] == 'Smartphones']
+    if smartphone_row.empty:
+        return "**Domínio Mobile:** Dados de dispositivo indisponíveis ou incompletos.", {}
+
+    smartphone_share = smartphone_row['Porcentagem Custo'].iloc[0]
+    por_dispositivo = df_dispositivos.set_index('Dispositivo').reindex(['Smartphones', 'Computadores', 'Tablets'])
+    cpa = por_dispositivo['CPA'].fillna(0)
+
+    # Comparação de CPA só é afirmada quando os intervalos de confiança não se sobrepõem
+    comparacoes_cpa = []
+    # Dispositivo -> Smartphone tem CPA menor (True) ou maior (False); só diferenças significativas
+    diferencas_cpa = {}
+    for dispositivo in ['Computadores', 'Tablets']:
+        sobrepostos = intervalos_sobrepostos(*por_dispositivo.loc['Smartphones', ['CPA_IC_Inf', 'CPA_IC_Sup']], *por_dispositivo.loc[dispositivo, ['CPA_IC_Inf', 'CPA_IC_Sup']])
+        conclusao = "diferença não conclusiva" if sobrepostos else "diferença significativa"
+        if not sobrepostos:
+            diferencas_cpa[dispositivo] = cpa['Smartphones'] < cpa[dispositivo]
+        comparacoes_cpa.append(f"{dispositivo} (**R$ {cpa[dispositivo]:.2f}**, IC 95% R$ {por_dispositivo.loc[dispositivo, 'CPA_IC_Inf']:.2f}–{por_dispositivo.loc[dispositivo, 'CPA_IC_Sup']:.2f}: {conclusao})")
+
+    texto = f"""
+    **Domínio Mobile:** O **Smartphone** é o dispositivo dominante, representando **{smartphone_share:,.1f}% do Custo Total**. O CPA no Smartphone (**R$ {cpa['Smartphones']:.2f}**, IC 95% R$ {por_dispositivo.loc['Smartphones', 'CPA_IC_Inf']:.2f}–{por_dispositivo.loc['Smartphones', 'CPA_IC_Sup']:.2f}) comparado a {comparacoes_cpa[0]} e {comparacoes_cpa[1]}.
+    """
+    return texto, {'diferencas_cpa': diferencas_cpa}
+
+
+def _insight_temporal(df_dia_ordenado, df_hora, detalhe_temporal):
+    highest_day = df_dia_ordenado.iloc[df_dia_ordenado['Impressões'].argmax()]['Dia']
+    highest_hour = int(df_hora.iloc[df_hora['Impressões'].argmax()]['Hora de início'])
+    texto = f"""
+    **Pico Temporal:** O **{highest_day}** e a **Hora {highest_hour} ({highest_hour}h)** são os horários de pico de impressões. {REFERENCIAS_TEMPORAIS[detalhe_temporal]} nas noites de **Terça, Quarta e Quinta-feira** (geralmente entre 18h e 22h).
+    """
+    return texto, {'highest_hour': highest_hour}
+
+
+def _insight_demografico(cubo):
+    # Participações do cubo, as mesmas exibidas na aba de demografia
+    df_sexo = demografia.marginal(cubo, ['Sexo'])
+    df_idade = demografia.marginal(cubo, ['Faixa de idade'])
+    top_age = df_idade.iloc[df_idade['Impressões'].argmax()]
+    masculino = df_sexo[df_sexo['Sexo'] == 'Masculino']['Participação']
+    sex_ratio_m = f"{masculino.iloc[0]:.2f}%" if not masculino.empty else "N/A"
+    texto = f"""
+    **Público-alvo Forte:** O público **Masculino ({sex_ratio_m})** domina as impressões. A faixa etária mais forte é **{top_age['Faixa de idade']}**, representando **{top_age['Participação']:.2f}%** das impressões conhecidas.
+    """
+    return texto, {}
+
+
+def _insight_palavras_chave(df_kw_custo, df_kw_ctr):
+    kw_alto_custo = df_kw_custo.iloc[0]['Palavra-chave da rede de pesquisa'] if not df_kw_custo.empty else "N/A"
+    kw_alto_ctr = df_kw_ctr.iloc[0]['Palavra-chave da rede de pesquisa'] if not df_kw_ctr.empty else "N/A"
+    texto = f"""
+    **Oportunidades de Otimização (KW):** Palavras-chave como **'{kw_alto_custo}'** consomem muito custo. Palavras com alto CTR, como **'{kw_alto_ctr}'**, indicam alta relevância e merecem atenção especial.
+    """
+    return texto, {'kw_alto_custo': kw_alto_custo, 'kw_alto_ctr': kw_alto_ctr}
+
+
+def _insight_alteracoes(df_alteracoes):
+    if df_alteracoes.empty:
+        return "**Maiores Alterações:** Sem dados de comparação entre períodos.", {}
+    camp_crescimento_custo = df_alteracoes.iloc[0]['Nome da campanha']
+    maior_cliques = df_alteracoes.loc[df_alteracoes['Cliques_Percentual'].idxmax()]
+    camp_crescimento_cliques = maior_cliques['Nome da campanha']
+    # A variação de cliques só é tratada como real quando o IC 95% não inclui 0%
+    inferior, superior = maior_cliques['Cliques_Percentual_IC_Inf'], maior_cliques['Cliques_Percentual_IC_Sup']
+    if inferior > 0:
+        conclusao = f"O aumento de cliques (IC 95% de {inferior:+.1f}% a {superior:+.1f}%) indica uma mudança real no volume de tráfego, possivelmente devido a alterações de lance, orçamento ou status."
+    else:
+        conclusao = f"O IC 95% da variação de cliques ({inferior:+.1f}% a {superior:+.1f}%) inclui 0%: com esse volume, a mudança ainda pode ser variação normal entre períodos."
+    texto = f"""
+    **Maiores Alterações:** A campanha **'{camp_crescimento_custo}'** teve o maior crescimento percentual no Custo, enquanto a **'{camp_crescimento_cliques}'** teve o maior aumento percentual de Cliques. {conclusao}
+    """
+    return texto, {'camp_crescimento_cliques': camp_crescimento_cliques, 'cliques_significativo': inferior > 0}
+
+
+def _recomendacao_dispositivos(diferencas_cpa):
+    """Ajuste de lance por dispositivo, recomendado só quando a diferença de CPA é significativa."""
+    if diferencas_cpa is None:
+        return "* **Ajuste de Lance (Bid Adjustment):** Dados de dispositivo indisponíveis."
+    mais_caros = [d for d, smartphone_menor in diferencas_cpa.items() if smartphone_menor]
+    mais_baratos = [d for d, smartphone_menor in diferencas_cpa.items() if not smartphone_menor]
+    linhas = []
+    if mais_caros:
+        linhas.append(f"* **Ajuste de Lance (Bid Adjustment):** O CPA no Smartphone é significativamente menor que em {' e '.join(mais_caros)}: **aumente** o ajuste de lance para Smartphones e considere **reduzi-lo** em {' e '.join(mais_caros)}.")
+    if mais_baratos:
+        linhas.append(f"* **Ajuste de Lance (Bid Adjustment):** {' e '.join(mais_baratos)} tem CPA significativamente menor que o Smartphone: considere **aumentar** o ajuste de lance nesse(s) dispositivo(s).")
+    if not linhas:
+        linhas.append("* **Ajuste de Lance (Bid Adjustment):** As diferenças de CPA entre dispositivos ainda não são conclusivas (intervalos de confiança sobrepostos). **Mantenha** os ajustes atuais e reavalie quando houver mais conversões.")
+    return "\n        ".join(linhas)
+
+
+def _recomendacao_alteracoes(campanha, significativo):
+    """Investigação da campanha com maior aumento de cliques, só quando o aumento é significativo."""
+    if significativo:
+        return f"* **Investigar Mudanças:** A campanha com maior crescimento de Cliques ({campanha}) deve ser **analisada em detalhe** para garantir que o aumento de tráfego esteja acompanhado por um aumento proporcional de Conversões e um CPA saudável."
+    return f"* **Acompanhar:** Nenhum aumento de Cliques entre os períodos é estatisticamente conclusivo; acompanhe a campanha {campanha} no próximo período antes de mudar lances ou orçamento."
+
+
+def generate_insights_and_recommendations(dados, detalhe_temporal="mapa_calor"):
+    """Gera o texto dos insights e das recomendações a partir das tabelas preparadas em campanhas.metricas.
+
+    Retorna (insights, recomendacoes): a lista de insights disponíveis e o texto em markdown das recomendações.
+    """
+    insights = []
+    valores = {
+        'diferencas_cpa': None, 'highest_hour': "N/A",
+        'kw_alto_custo': "N/A", 'kw_alto_ctr': "N/A", 'camp_crescimento_cliques': "N/A",
+        'cliques_significativo': False,
+    }
+
+    etapas = [
+        (("Dispositivos",), lambda: _insight_dispositivos(dados["Dispositivos"])),
+        (("Dia_Ordenado", "Hora"), lambda: _insight_temporal(dados["Dia_Ordenado"], dados["Hora"], detalhe_temporal)),
+        (("Cubo_Demografico",), lambda: _insight_demografico(dados["Cubo_Demografico"])),
+        (("KW_Custo", "KW_CTR"), lambda: _insight_palavras_chave(dados["KW_Custo"], dados["KW_CTR"])),
+        (("Alteracoes",), lambda: _insight_alteracoes(dados["Alteracoes"])),
+    ]
+    for chaves, gerar in etapas:
+        if all(chave in dados for chave in chaves):
+            texto, extras = gerar()
+            insights.append(texto)
+            valores.update(extras)
+
+    recomendacoes = f"""
+    1.  **Otimização por Dispositivo:**
+        {_recomendacao_dispositivos(valores['diferencas_cpa'])}
+
+    2.  **Ajuste Temporal:**
+        * **Programação de Anúncios (Ad Scheduling):** Concentre seus maiores lances e/ou maior parte do orçamento nas noites de **Terça, Quarta e Quinta** (principalmente entre **18h e 22h**) e na **Hora {valores['highest_hour']}** para aproveitar o pico de impressões.
+        * **Redução:** Reduza lances nas madrugadas e inícios de manhã para otimizar o orçamento.
+
+    3.  **Segmentação Demográfica:**
+        * **Foco no Core:** Reforce a segmentação para o público **Masculino, 35 a 54 anos**, que é o seu público mais engajado.
+        * **Exclusão/Redução:** Considere diminuir lances para a faixa **18 a 24** e o público **Feminino**.
+
+    4.  **Gestão de Palavras-chave:**
+        * **Análise de Custo (KW: '{valores['kw_alto_custo']}'):** Verifique se o alto custo dessa palavra-chave está gerando um CPA aceitável. Caso contrário, refine a correspondência ou adicione termos de pesquisa negativos.
+        * **Aproveitamento de CTR (KW: '{valores['kw_alto_ctr']}'):** Aumente o orçamento e/ou o lance para palavras-chave de alto CTR.
+
+    5.  **Análise de Campanha (Comparativo):**
+        {_recomendacao_alteracoes(valores['camp_crescimento_cliques'], valores['cliques_significativo'])}
+    """
+    return insights, recomendacoes
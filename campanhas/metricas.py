@@ -0,0 +1,118 @@
+import numpy as np
+
+from campanhas.dados import DAY_ORDER, periodo_arquivo
+from campanhas.demografia import construir_cubo, cubo_para_tabela
+
+# --- Métricas Derivadas ---
+# Cada seção do dashboard tem sua função de preparo, chamada apenas quando a seção
+# é aberta; o resultado fica em cache, e cada variante de gráfico só lê as tabelas prontas.
+
+
+def variacao_percentual(atual, comparacao):
+    """Variação % entre dois períodos. Sem base de comparação: 100% se houve valor atual, senão 0%."""
+    atual = np.asarray(atual, dtype=float)
+    comparacao = np.asarray(comparacao, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        variacao = (atual - comparacao) / comparacao * 100
+    return np.where(comparacao != 0, variacao, np.where(atual > 0, 100.0, 0.0))
+
+
+def totais_campanhas(df_campanhas):
+    """Custo total, conversões totais e CPA médio das campanhas."""
+    total_custo = df_campanhas['Custo'].sum()
+    total_conversoes = df_campanhas['Conversões'].sum()
+    total_cpa = total_custo / total_conversoes if total_conversoes > 0 else 0
+    return total_custo, total_conversoes, total_cpa
+
+
+def preparar_campanhas(data):
+    """Campanhas com o CPA calculado (NaN para campanhas sem conversão)."""
+    df = data["Campanhas"].copy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        df['CPA_Calc'] = np.where(df['Conversões'] > 0, df['Custo'] / df['Conversões'], np.nan)
+    return {"Campanhas": df}
+
+
+def preparar_dispositivos(data):
+    """Dispositivos com participação no custo/conversões e CPA (sem conversões, o CPA é o próprio custo)."""
+    df = data["Dispositivos"].copy()
+    df['Porcentagem Custo'] = (df['Custo'] / df['Custo'].sum()) * 100
+    df['Porcentagem Conversões'] = (df['Conversões'] / df['Conversões'].sum()) * 100
+    with np.errstate(divide='ignore', invalid='ignore'):
+        df['CPA'] = np.where(df['Conversões'] > 0, df['Custo'] / df['Conversões'], df['Custo'])
+    return {"Dispositivos": df}
+
+
+def preparar_temporal(data):
+    """Dias na ordem da semana e a matriz hora x dia do mapa de calor."""
+    mapa_calor = data["Dia_Hora"].pivot_table(index='Hora de início', columns='Dia', values='Impressões', fill_value=0)
+    return {
+        "Dia_Ordenado": data["Dia"].set_index('Dia').reindex(DAY_ORDER).reset_index(),
+        "Hora": data["Hora"],
+        "Dia_Hora": data["Dia_Hora"],
+        "Mapa_Calor": mapa_calor.reindex(columns=DAY_ORDER, fill_value=0),
+    }
+
+
+def preparar_demografia(data):
+    """Cubo demográfico (sexo x idade x período x campanha) e sua versão em tabela longa."""
+    cubo = construir_cubo(data["Sexo_Idade"], data["Sexo"], data["Idade"], periodo=periodo_arquivo("Sexo_Idade"))
+    return {"Cubo_Demografico": cubo, "Demografia": cubo_para_tabela(cubo)}
+
+
+def preparar_palavras_chave(data):
+    """Rankings de palavras-chave por custo e por CTR, já ordenados de forma decrescente para o Top N."""
+    df = data["Palavras_Chave"]
+    # Custo 0 fica fora do ranking de custo; Cliques 0 (CTR 0) fica fora do ranking de CTR
+    df_custo = df[df['Custo'] > 0].sort_values(by='Custo', ascending=False, kind='stable')
+    df_ctr = df[df['Cliques'] > 0].sort_values(by='CTR', ascending=False, kind='stable')
+    # Barras de erro do CTR (IC 95%): palavras com poucas impressões têm CTR pouco confiável
+    df_ctr = df_ctr.assign(
+        CTR_Erro_Sup=df_ctr['CTR_IC_Sup'] - df_ctr['CTR'],
+        CTR_Erro_Inf=df_ctr['CTR'] - df_ctr['CTR_IC_Inf']
+    )
+    return {"KW_Custo": df_custo, "KW_CTR": df_ctr}
+
+
+def preparar_alteracoes(data):
+    """Diferenças e variações % entre os períodos, ordenadas pela variação de custo."""
+    df = data["Alteracoes"].copy()
+    df['Custo_Diferenca'] = df['Custo'] - df['Custo (Comparação)']
+    df['Cliques_Diferenca'] = df['Cliques'] - df['Cliques (Comparação)']
+    df['Custo_Percentual'] = variacao_percentual(df['Custo'], df['Custo (Comparação)'])
+    df['Cliques_Percentual'] = variacao_percentual(df['Cliques'], df['Cliques (Comparação)'])
+    return {"Alteracoes": df.sort_values(by='Custo_Percentual', ascending=False)}
+
+
+# Seção -> (arquivos necessários, função de preparo). Cada seção prepara só o que exibe.
+PREPARADORES = {
+    "campanhas": (("Campanhas",), preparar_campanhas),
+    "dispositivos": (("Dispositivos",), preparar_dispositivos),
+    "temporal": (("Dia", "Hora", "Dia_Hora"), preparar_temporal),
+    "demografia": (("Idade", "Sexo", "Sexo_Idade"), preparar_demografia),
+    "palavras_chave": (("Palavras_Chave",), preparar_palavras_chave),
+    "alteracoes": (("Alteracoes",), preparar_alteracoes),
+}
+
+
+def preparar_secao(data, secao):
+    """Tabelas de uma seção, ou dicionário vazio se algum arquivo necessário não foi carregado."""
+    chaves, preparar = PREPARADORES[secao]
+    if not all(chave in data for chave in chaves):
+        return {}
+    return preparar(data)
+
+
+def preparar_metricas(data):
+    """Todas as tabelas derivadas de uma vez (para uso fora do dashboard). Seções indisponíveis são omitidas."""
+    dados = dict(data)
+    for secao in PREPARADORES:
+        dados.update(preparar_secao(data, secao))
+    return dados
+
+
+def top_palavras_chave(dados, top_n):
+    """Top N palavras-chave por custo e por CTR, em ordem crescente (a maior fica no topo do gráfico horizontal)."""
+    df_kw_top_custo = dados["KW_Custo"].head(top_n).iloc[::-1]
+    df_kw_top_ctr = dados["KW_CTR"].head(top_n).iloc[::-1]
+    return df_kw_top_custo, df_kw_top_ctr
@@ -0,0 +1,417 @@
+import streamlit as st
+
+from campanhas import demografia, exportacao, historico
+from campanhas.dados import DIRETORIO_DADOS, VERSAO_CARREGAMENTO, assinatura_arquivos, load_and_preprocess_data
+from campanhas.insights import generate_insights_and_recommendations
+from campanhas.metricas import preparar_secao, top_palavras_chave, totais_campanhas
+
+# --- Seções do Dashboard ---
+# app.py e app0.py são apenas layouts: escolhem a variante de cada seção e montam
+# as abas com as funções abaixo. Só a aba aberta executa; o preparo dos dados e as
+# figuras de cada seção ficam em cache, chaveados pela assinatura dos exports.
+#
+# campanhas.graficos (e com ele o plotly) só é importado dentro das funções de
+# figuras, na primeira vez que um gráfico é de fato construído: um worker novo
+# desenha o cabeçalho e as métricas antes de pagar esse import.
+
+
+@st.cache_data(persist="disk", show_spinner="Carregando dados das campanhas...")
+def _carregar_em_cache(diretorio, versao, assinatura):
+    """Carrega e valida os exports uma única vez por versão dos arquivos e do código.
+
+    Persistido em disco e chaveado pela pasta dos dados, pela `versao` do código de
+    carregamento e pela `assinatura` dos arquivos: os dois dashboards (inclusive em
+    processos diferentes) reaproveitam o mesmo cache, que é refeito sozinho quando
+    algum CSV é substituído ou a limpeza/validação muda.
+    """
+    return load_and_preprocess_data(diretorio)
+
+
+@st.cache_data(show_spinner=False)
+def _preparar(secao, assinatura, _data):
+    """Tabelas de uma seção. `_data` não entra na chave do cache (já representada pela assinatura)."""
+    return preparar_secao(_data, secao)
+
+
+def carregar():
+    """Carrega os dados do cache compartilhado e exibe o relatório de validação.
+
+    Retorna (data, assinatura), repassados às seções. Interrompe a página se nada carregou.
+    """
+    assinatura = assinatura_arquivos()
+    data, problemas = _carregar_em_cache(str(DIRETORIO_DADOS), VERSAO_CARREGAMENTO, assinatura)
+
+    # Relatório de validação: erros indicam arquivos descartados, avisos apenas sinalizam
+    for problema in problemas:
+        mensagem = f"**{problema['arquivo']}** ({problema['verificacao']}): {problema['mensagem']}"
+        if problema['nivel'] == "erro":
+            st.error(mensagem)
+        else:
+            st.warning(mensagem)
+
+    if not data:
+        st.stop()
+    return data, assinatura
+
+
+def secao_disponivel(data, *chaves):
+    """Indica se os arquivos de uma seção passaram na validação; caso contrário avisa que a seção foi pulada."""
+    faltando = [chave for chave in chaves if chave not in data]
+    if faltando:
+        st.warning(f"Seção indisponível: arquivo(s) {', '.join(faltando)} não carregado(s).")
+        return False
+    return True
+
+
+def exibir_em_abas(secoes):
+    """Mostra as seções em abas; só a função da aba selecionada é executada.
+
+    `secoes` é uma lista de (título, função sem argumentos). A aba escolhida fica na
+    URL (?secao=...), então links para uma seção específica continuam funcionando.
+    """
+    abas = st.tabs([titulo for titulo, _ in secoes], key="secao", on_change="rerun", bind="query-params")
+    for aba, (_, exibir) in zip(abas, secoes):
+        if aba.open:
+            with aba:
+                exibir()
+
+
+# --- 1. Visão Geral das Campanhas ---
+@st.cache_data(show_spinner=False)
+def _figuras_campanhas(assinatura, grafico, _tabelas):
+    from campanhas import graficos
+
+    df_campanhas = _tabelas["Campanhas"]
+    if grafico == "cpa":
+        return graficos.fig_campanhas_cpa(df_campanhas)
+    return graficos.fig_campanhas_dispersao(df_campanhas)
+
+
+def secao_campanhas(data, assinatura, grafico="dispersao"):
+    """Métricas totais e gráfico por campanha: "dispersao" (Custo vs. Conversões) ou "cpa" (CPA em barras)."""
+    st.header("1. Desempenho das Campanhas")
+    if not secao_disponivel(data, "Campanhas"):
+        return
+    tabelas = _preparar("campanhas", assinatura, data)
+
+    # Métricas Totais
+    total_custo, total_conversoes, total_cpa = totais_campanhas(tabelas["Campanhas"])
+    col1, col2, col3 = st.columns(3)
+    col1.metric("💰 Custo Total", f"R$ {total_custo:,.2f}")
+    col2.metric("✅ Conversões Totais", f"{total_conversoes:,.0f}")
+    col3.metric("🎯 CPA Médio", f"R$ {total_cpa:,.2f}")
+
+    st.markdown("---")
+
+    if grafico == "cpa":
+        st.subheader("Eficiência por Campanha (CPA - Custo por Conversão)")
+    else:
+        st.subheader("Desempenho por Campanha (Custo vs. Conversões)")
+    st.plotly_chart(_figuras_campanhas(assinatura, grafico, tabelas), width="stretch")
+
+
+# --- 2. Análise de Dispositivos ---
+@st.cache_data(show_spinner=False)
+def _figuras_dispositivos(assinatura, _tabelas):
+    from campanhas import graficos
+
+    df_dispositivos = _tabelas["Dispositivos"]
+    return graficos.fig_custo_dispositivo(df_dispositivos), graficos.fig_conversoes_dispositivo(df_dispositivos)
+
+
+def secao_dispositivos(data, assinatura):
+    """Custo, conversões e CPA (com IC 95%) por dispositivo."""
+    st.header("2. Desempenho por Dispositivo")
+    if not secao_disponivel(data, "Dispositivos"):
+        return
+    tabelas = _preparar("dispositivos", assinatura, data)
+    df_dispositivos = tabelas["Dispositivos"]
+    fig_custo, fig_conversoes = _figuras_dispositivos(assinatura, tabelas)
+
+    col_disp1, col_disp2 = st.columns(2)
+    with col_disp1:
+        st.subheader("Distribuição de Custo por Dispositivo")
+        st.plotly_chart(fig_custo, width="stretch")
+    with col_disp2:
+        st.subheader("Conversões e CPA por Dispositivo")
+        st.plotly_chart(fig_conversoes, width="stretch")
+
+    st.subheader("CPA e Taxa de Conversão com Intervalo de Confiança (95%)")
+    st.caption("Com poucas conversões o intervalo fica largo: diferenças de CPA entre dispositivos cujos intervalos se sobrepõem não são conclusivas.")
+    st.dataframe(
+        df_dispositivos[['Dispositivo', 'Conversões', 'CPA', 'CPA_IC_Inf', 'CPA_IC_Sup', 'Taxa_Conversao', 'Taxa_Conversao_IC_Inf', 'Taxa_Conversao_IC_Sup']].style.format({
+            'Conversões': '{:,.0f}',
+            'CPA': 'R$ {:,.2f}',
+            'CPA_IC_Inf': 'R$ {:,.2f}',
+            'CPA_IC_Sup': 'R$ {:,.2f}',
+            'Taxa_Conversao': '{:.2f}%',
+            'Taxa_Conversao_IC_Inf': '{:.2f}%',
+            'Taxa_Conversao_IC_Sup': '{:.2f}%',
+        }, na_rep='-'),
+        hide_index=True,
+        width="stretch"
+    )
+
+
+# --- 3. Análise Temporal ---
+@st.cache_data(show_spinner=False)
+def _figuras_temporal(assinatura, detalhe, _tabelas):
+    from campanhas import graficos
+
+    fig_dia = graficos.fig_impressoes_dia(_tabelas["Dia_Ordenado"])
+    fig_hora = graficos.fig_impressoes_hora(_tabelas["Hora"])
+    if detalhe == "linhas":
+        fig_detalhe = graficos.fig_linhas_por_dia(_tabelas["Dia_Hora"])
+    else:
+        fig_detalhe = graficos.fig_mapa_calor(_tabelas["Mapa_Calor"])
+    return fig_dia, fig_hora, fig_detalhe
+
+
+def secao_temporal(data, assinatura, detalhe="mapa_calor"):
+    """Impressões por dia e por hora, com o detalhe dia x hora como "mapa_calor" ou "linhas" (facetado por dia)."""
+    st.header("3. Análise Temporal de Impressões")
+    if not secao_disponivel(data, "Dia", "Hora", "Dia_Hora"):
+        return
+    fig_dia, fig_hora, fig_detalhe = _figuras_temporal(assinatura, detalhe, _preparar("temporal", assinatura, data))
+
+    col_temp1, col_temp2 = st.columns(2)
+    with col_temp1:
+        st.subheader("Impressões por Dia da Semana")
+        st.plotly_chart(fig_dia, width="stretch")
+    with col_temp2:
+        st.subheader("Impressões por Hora do Dia")
+        st.plotly_chart(fig_hora, width="stretch")
+
+    if detalhe == "linhas":
+        st.subheader("Análise Detalhada: Tendência Horária por Dia")
+    else:
+        st.subheader("Mapa de Calor: Impressões por Dia e Hora")
+    st.plotly_chart(fig_detalhe, width="stretch")
+
+
+# --- 4. Análise Demográfica ---
+@st.cache_data(show_spinner=False, max_entries=64)
+def _figuras_demografia(assinatura, filtros, _tabelas):
+    from campanhas import graficos
+
+    # `filtros` é uma tupla de (eixo, rótulo) para entrar na chave do cache
+    filtros = dict(filtros)
+    sexo = filtros.pop('Sexo', None)
+    cubo = demografia.fatiar(_tabelas["Cubo_Demografico"], filtros)
+    titulo_idade = f'Impressões por Idade ({sexo})' if sexo else 'Impressões por Idade'
+    df_idade = demografia.marginal(demografia.fatiar(cubo, {'Sexo': sexo} if sexo else {}), ['Faixa de idade'])
+    df_sexo_idade = demografia.marginal(cubo, ['Sexo', 'Faixa de idade'])
+    return graficos.fig_impressoes_idade(df_idade, titulo_idade), graficos.fig_impressoes_sexo_idade(df_sexo_idade)
+
+
+def secao_demografica(data, assinatura):
+    """Impressões por faixa etária e por sexo x faixa etária, com recorte por sexo (e por período/campanha, se houver mais de um)."""
+    st.header("4. Informações Demográficas (Impressões)")
+    if not secao_disponivel(data, "Idade", "Sexo", "Sexo_Idade"):
+        return
+    tabelas = _preparar("demografia", assinatura, data)
+    cubo = tabelas["Cubo_Demografico"]
+
+    filtros = {}
+    for eixo in ['Período', 'Campanha']:
+        if len(cubo["eixos"][eixo]) > 1:
+            filtros[eixo] = st.selectbox(f"{eixo}:", cubo["eixos"][eixo])
+
+    # Participação de cada sexo no total conhecido, direto do cubo
+    df_sexo = demografia.marginal(demografia.fatiar(cubo, filtros), ['Sexo'])
+    for coluna, linha in zip(st.columns(len(df_sexo)), df_sexo.itertuples()):
+        coluna.metric(linha.Sexo, f"{linha.Impressões:,.0f}", f"{linha.Participação:.2f}% do total conhecido", delta_color="off")
+
+    sexo = st.radio("Detalhar faixa etária por sexo:", ["Todos", *df_sexo['Sexo']], horizontal=True)
+    if sexo != "Todos":
+        filtros['Sexo'] = sexo
+    fig_idade, fig_sexo_idade = _figuras_demografia(assinatura, tuple(filtros.items()), tabelas)
+
+    col_demo1, col_demo2 = st.columns(2)
+    with col_demo1:
+        st.subheader("Impressões por Faixa Etária")
+        st.plotly_chart(fig_idade, width="stretch")
+    with col_demo2:
+        st.subheader("Impressões por Sexo e Idade")
+        st.plotly_chart(fig_sexo_idade, width="stretch")
+
+
+# --- 5. Palavras-chave ---
+@st.cache_data(show_spinner=False)
+def _figuras_palavras_chave(assinatura, top_n, _tabelas):
+    from campanhas import graficos
+
+    df_kw_top_custo, df_kw_top_ctr = top_palavras_chave(_tabelas, top_n)
+    return graficos.fig_palavras_chave_custo(df_kw_top_custo, top_n), graficos.fig_palavras_chave_ctr(df_kw_top_ctr, top_n)
+
+
+def secao_palavras_chave(data, assinatura):
+    """Top N palavras-chave por custo e por CTR, com N escolhido no slider."""
+    st.header("5. Desempenho das Palavras-chave")
+    if not secao_disponivel(data, "Palavras_Chave"):
+        return
+
+    top_n_keywords = st.slider("Selecione o Top N de Palavras-chave:", 5, 50, 15)
+    fig_kw_custo, fig_kw_ctr = _figuras_palavras_chave(assinatura, top_n_keywords, _preparar("palavras_chave", assinatura, data))
+    st.plotly_chart(fig_kw_custo, width="stretch")
+    st.plotly_chart(fig_kw_ctr, width="stretch")
+
+    secao_historico_palavras_chave()
+
+
+@st.cache_resource(show_spinner="Atualizando histórico de palavras-chave...", max_entries=2)
+def _indice_historico(assinatura_historico):
+    """Registra exports de períodos novos no histórico e indexa a tabela, uma vez por versão dos arquivos.
+
+    cache_resource (e não cache_data): o índice é só lido e fica em memória como está,
+    sem ser copiado a cada execução da página. Rótulos do seletor e palavras com CTR
+    em queda são calculados aqui, junto com o índice, em vez de a cada movimento de widget.
+    """
+    indice = historico.construir_indice(historico.atualizar_historico())
+    rotulos = {f"{palavra} ({tipo})": (palavra, tipo) for palavra, tipo in indice["posicoes"]}
+    return {
+        "indice": indice,
+        "rotulos": rotulos,
+        "opcoes": list(rotulos),
+        "decaindo": historico.detectar_decaimento_ctr(indice),
+        "n_periodos": len(set(indice["colunas"]['Fim'])),
+    }
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _figura_trajetoria(assinatura_historico, chave, _indice):
+    from campanhas import graficos
+
+    palavra, tipo = chave
+    return graficos.fig_trajetoria_palavra_chave(historico.trajetoria(_indice, chave), f'{palavra} ({tipo})')
+
+
+def secao_historico_palavras_chave():
+    """Trajetória de uma palavra-chave entre os períodos exportados e palavras com CTR em queda."""
+    st.subheader("Histórico por Palavra-chave")
+    assinatura_historico = historico.assinatura_historico()
+    cache = _indice_historico(assinatura_historico)
+    indice = cache["indice"]
+    if not indice["posicoes"]:
+        st.info("Nenhum export de palavras-chave registrado no histórico.")
+        return
+
+    st.caption(
+        f"{cache['n_periodos']} período(s) registrado(s). Exports de outros períodos colocados na pasta dos dados "
+        "ou em `historico/exports` são acrescentados ao histórico automaticamente."
+    )
+
+    rotulos = cache["rotulos"]
+    chave = rotulos[st.selectbox("Palavra-chave:", cache["opcoes"])]
+    st.plotly_chart(_figura_trajetoria(assinatura_historico, chave, indice), width="stretch")
+    pausa = historico.primeira_pausa(indice, chave)
+    if pausa is not None:
+        st.warning(f"Palavra-chave pausada no período encerrado em {pausa}.")
+
+    st.markdown(f"**CTR em queda** (pelo menos {historico.MIN_PERIODOS} períodos e queda de {historico.QUEDA_MINIMA:.0%} ou mais na tendência)")
+    decaindo = cache["decaindo"]
+    if decaindo.empty:
+        st.caption("Nenhuma palavra-chave com CTR em queda no histórico atual.")
+        return
+    # Formatação via column_config: com milhares de palavras-chave, um Styler seria
+    # renderizado de novo a cada execução da página
+    st.dataframe(
+        decaindo,
+        column_config={
+            'CTR_Inicial': st.column_config.NumberColumn(format="%.2f%%"),
+            'CTR_Final': st.column_config.NumberColumn(format="%.2f%%"),
+            'Queda_Relativa': st.column_config.NumberColumn(format="percent"),
+        },
+        hide_index=True,
+        width="stretch"
+    )
+
+
+# --- 6. Comparativo de Períodos ---
+@st.cache_data(show_spinner=False)
+def _figuras_alteracoes(assinatura, _tabelas):
+    from campanhas import graficos
+
+    return graficos.fig_alteracoes(_tabelas["Alteracoes"])
+
+
+def secao_alteracoes(data, assinatura):
+    """Variação percentual de custo e cliques por campanha entre os dois períodos."""
+    st.header("6. Maiores Alterações (Comparação Mês a Mês)")
+    if not secao_disponivel(data, "Alteracoes"):
+        return
+
+    st.subheader("Alteração Percentual de Custo e Cliques por Campanha")
+    st.plotly_chart(_figuras_alteracoes(assinatura, _preparar("alteracoes", assinatura, data)), width="stretch")
+
+
+# --- 7. Insights e Recomendações ---
+@st.cache_data(show_spinner=False)
+def _textos_insights(assinatura, detalhe_temporal, _data):
+    # Só o preparo de tabelas (sem figuras) das seções que alimentam os insights
+    dados = dict(_data)
+    for secao in ["dispositivos", "temporal", "demografia", "palavras_chave", "alteracoes"]:
+        dados.update(_preparar(secao, assinatura, _data))
+    return generate_insights_and_recommendations(dados, detalhe_temporal)
+
+
+def secao_insights(data, assinatura, detalhe_temporal="mapa_calor"):
+    """Insights das seções disponíveis e recomendações de otimização."""
+    st.header("💡 Insights e Recomendações")
+    st.markdown("---")
+
+    insights, recomendacoes = _textos_insights(assinatura, detalhe_temporal, data)
+
+    st.subheader("Descobertas Chave (Insights)")
+    for insight in insights:
+        st.info(insight)
+
+    st.subheader("Recomendações de Otimização")
+    st.markdown(recomendacoes)
+
+
+# --- Exportação ---
+@st.cache_data(show_spinner=False, max_entries=64)
+def _arquivo_exportacao(assinatura, nome, formato, _data):
+    """Bytes de uma tabela no formato escolhido, gerados uma vez por versão dos exports e reaproveitados por todos os usuários."""
+    return exportacao.serializar(exportacao.obter_tabela(_data, nome), formato)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _pacote_exportacao(assinatura, formato, _data):
+    return exportacao.empacotar({
+        exportacao.nome_arquivo(nome, formato): _arquivo_exportacao(assinatura, nome, formato, _data)
+        for nome in exportacao.nomes_tabelas(_data)
+    })
+
+
+def secao_exportacao(data, assinatura):
+    """Download das tabelas limpas e dos agregados do dashboard (CSV, Parquet ou Excel)."""
+    st.header("⬇️ Exportar Dados")
+    st.caption("Tabelas já limpas (valores numéricos, sem 'R$' ou '%') e agregados calculados pelo dashboard, prontos para notebooks.")
+
+    formatos = exportacao.formatos_disponiveis()
+    nomes = exportacao.nomes_tabelas(data)
+    col_tabela, col_formato = st.columns([2, 1])
+    nome = col_tabela.selectbox("Tabela:", nomes)
+    formato = col_formato.radio("Formato:", formatos, horizontal=True)
+    if len(formatos) < len(exportacao.FORMATOS):
+        st.caption("Instale `pyarrow` (Parquet) e `openpyxl` (Excel) para habilitar os demais formatos.")
+
+    extensao, mime, _ = exportacao.FORMATOS[formato]
+    # Os arquivos só são gerados no clique, fora da execução da página (o Streamlit roda o callable em outra thread)
+    col_um, col_todos = st.columns(2)
+    col_um.download_button(
+        f"Baixar {nome}.{extensao}",
+        data=lambda: _arquivo_exportacao(assinatura, nome, formato, data),
+        file_name=exportacao.nome_arquivo(nome, formato),
+        mime=mime,
+        on_click="ignore"
+    )
+    col_todos.download_button(
+        f"Baixar todas as tabelas ({formato}, .zip)",
+        data=lambda: _pacote_exportacao(assinatura, formato, data),
+        file_name=f"campanhas_{extensao}.zip",
+        mime="application/zip",
+        on_click="ignore"
+    )
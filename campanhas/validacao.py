@@ -0,0 +1,141 @@
+import numpy as np
+import pandas as pd
+
+# --- Validação dos Exports do Google Ads ---
+# Cada arquivo é validado em três etapas: cabeçalho (antes da limpeza), tipos e
+# faixas de valores (depois da limpeza) e, por fim, consistência dos totais entre
+# arquivos. Os problemas são devolvidos como uma lista de dicionários, para que o
+# dashboard exiba exatamente o que falhou sem interromper os arquivos válidos.
+
+# Colunas obrigatórias e faixa (mínimo, máximo) esperada de cada coluna numérica
+ESQUEMAS = {
+    "Campanhas": {
+        "colunas": ['Nome da campanha', 'Custo', 'Conversões', 'Custo / conv.'],
+        "faixas": {'Custo': (0, None), 'Conversões': (0, None), 'Custo / conv.': (0, None)},
+    },
+    "Dispositivos": {
+        "colunas": ['Dispositivo', 'Custo', 'Cliques', 'Conversões'],
+        "faixas": {'Custo': (0, None), 'Cliques': (0, None), 'Conversões': (0, None)},
+    },
+    "Redes": {
+        "colunas": ['Rede', 'Cliques', 'Custo'],
+        "faixas": {'Cliques': (0, None), 'Custo': (0, None)},
+    },
+    "Dia": {
+        "colunas": ['Dia', 'Impressões'],
+        "faixas": {'Impressões': (0, None)},
+    },
+    "Dia_Hora": {
+        "colunas": ['Dia', 'Hora de início', 'Impressões'],
+        "faixas": {'Impressões': (0, None)},
+    },
+    "Hora": {
+        "colunas": ['Hora de início', 'Impressões'],
+        "faixas": {'Hora de início': (0, 23), 'Impressões': (0, None)},
+    },
+    "Idade": {
+        "colunas": ['Faixa de idade', 'Impressões', 'Porcentagem do total conhecido'],
+        "faixas": {'Impressões': (0, None), 'Porcentagem do total conhecido': (0, 100)},
+    },
+    "Sexo": {
+        "colunas": ['Sexo', 'Impressões', 'Porcentagem do total conhecido'],
+        "faixas": {'Impressões': (0, None), 'Porcentagem do total conhecido': (0, 100)},
+    },
+    "Sexo_Idade": {
+        "colunas": ['Sexo', 'Faixa de idade', 'Impressões', 'Porcentagem do total conhecido'],
+        "faixas": {'Impressões': (0, None), 'Porcentagem do total conhecido': (0, 100)},
+    },
+    "Alteracoes": {
+        "colunas": ['Nome da campanha', 'Custo', 'Custo (Comparação)', 'Cliques', 'Cliques (Comparação)', 'Interações', 'Interações (Comparação)'],
+        "faixas": {
+            'Custo': (0, None), 'Custo (Comparação)': (0, None),
+            'Cliques': (0, None), 'Cliques (Comparação)': (0, None),
+            'Interações': (0, None), 'Interações (Comparação)': (0, None),
+        },
+    },
+    "Palavras_Chave": {
+        "colunas": ['Palavra-chave da rede de pesquisa', 'Status do critério', 'Custo', 'Cliques', 'CTR'],
+        "faixas": {'Custo': (0, None), 'Cliques': (0, None), 'CTR': (0, 100)},
+    },
+}
+
+# Totais que devem coincidir entre arquivos: métrica -> arquivos que a reportam
+TOTAIS_CRUZADOS = {
+    'Custo': ['Campanhas', 'Dispositivos', 'Redes'],
+    'Cliques': ['Dispositivos', 'Redes'],
+    'Conversões': ['Campanhas', 'Dispositivos'],
+    'Impressões': ['Dia', 'Hora', 'Dia_Hora'],
+}
+# Diferença aceita entre totais (arredondamento dos exports): 0,5% ou 1 unidade, o que for maior
+TOLERANCIA_RELATIVA = 0.005
+TOLERANCIA_ABSOLUTA = 1.0
+# Quantidade de linhas com problema citadas na mensagem
+MAX_LINHAS_CITADAS = 5
+
+
+def novo_problema(arquivo, nivel, verificacao, mensagem):
+    """Monta o registro de um problema. `nivel` é "erro" (arquivo descartado) ou "aviso" (arquivo mantido)."""
+    return {"arquivo": arquivo, "nivel": nivel, "verificacao": verificacao, "mensagem": mensagem}
+
+
+def validar_colunas(key, df):
+    """Confere o cabeçalho do arquivo bruto. Retorna a lista de problemas (vazia se o cabeçalho é válido)."""
+    esperadas = ESQUEMAS[key]["colunas"]
+    faltando = [col for col in esperadas if col not in df.columns]
+    if not faltando:
+        return []
+    return [novo_problema(
+        key, "erro", "colunas",
+        f"Colunas ausentes: {faltando}. Colunas encontradas: {list(df.columns)}."
+    )]
+
+
+def validar_valores(key, df):
+    """Confere tipos, valores não convertidos (NaN) e faixas das colunas numéricas já limpas."""
+    problemas = []
+    for col, (minimo, maximo) in ESQUEMAS[key]["faixas"].items():
+        if not pd.api.types.is_numeric_dtype(df[col]):
+            problemas.append(novo_problema(key, "erro", "tipo", f"Coluna '{col}' não é numérica após a limpeza (dtype {df[col].dtype})."))
+            continue
+
+        valores = df[col].to_numpy(dtype=float)
+        nulos = np.isnan(valores)
+        if len(valores) and nulos.all():
+            # Nenhum valor convertido: o formato da coluna mudou no export
+            problemas.append(novo_problema(key, "erro", "tipo", f"Coluna '{col}' não tem nenhum valor numérico após a limpeza; o formato do export mudou?"))
+            continue
+        if nulos.any():
+            linhas = np.flatnonzero(nulos)[:MAX_LINHAS_CITADAS].tolist()
+            problemas.append(novo_problema(key, "aviso", "tipo", f"Coluna '{col}' tem {int(nulos.sum())} valor(es) não numérico(s) (linhas {linhas})."))
+
+        fora = np.zeros(len(valores), dtype=bool)
+        if minimo is not None:
+            fora |= valores < minimo
+        if maximo is not None:
+            fora |= valores > maximo
+        if fora.any():
+            linhas = np.flatnonzero(fora)[:MAX_LINHAS_CITADAS].tolist()
+            problemas.append(novo_problema(
+                key, "aviso", "faixa",
+                f"Coluna '{col}' tem {int(fora.sum())} valor(es) fora da faixa [{minimo}, {maximo}] (linhas {linhas})."
+            ))
+    return problemas
+
+
+def validar_consistencia(data):
+    """Compara os totais de cada métrica entre os arquivos que a reportam (ex.: Custo em Campanhas, Dispositivos e Redes)."""
+    problemas = []
+    for metrica, arquivos in TOTAIS_CRUZADOS.items():
+        presentes = [key for key in arquivos if key in data]
+        if len(presentes) < 2:
+            continue
+        totais = np.array([data[key][metrica].sum() for key in presentes])
+        diferenca = totais.max() - totais.min()
+        tolerancia = max(TOLERANCIA_ABSOLUTA, TOLERANCIA_RELATIVA * np.abs(totais).max())
+        if diferenca > tolerancia:
+            detalhes = ", ".join(f"{key}: {total:,.2f}" for key, total in zip(presentes, totais))
+            problemas.append(novo_problema(
+                "/".join(presentes), "aviso", "consistência",
+                f"Total de '{metrica}' diverge entre arquivos em {diferenca:,.2f} ({detalhes})."
+            ))
+    return problemas
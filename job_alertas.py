@@ -0,0 +1,184 @@
+"""Job de alertas de KPI, sem o dashboard.
+
+Carrega os exports de cada conta com o mesmo código do dashboard (limpeza, validação e
+métricas de campanhas.metricas), avalia as regras de campanhas.alertas para todas as
+contas de uma vez e grava os alertas novos:
+
+- em <saida>/caixa_saida.jsonl (um alerta JSON por linha, só acrescentado);
+- opcionalmente em um webhook (POST JSON com a lista de alertas).
+
+Uma conta só é reavaliada quando a assinatura dos seus exports (a mesma que chaveia o
+cache do dashboard) ou as regras (metas de CPA, aumento de custo) mudam desde a última
+execução; o estado fica em <saida>/estado.json. Alertas que o webhook não recebeu
+ficam pendentes no estado e são reenviados nas próximas execuções, mesmo sem exports novos.
+
+Cada conta é uma pasta de exports, identificada pelo caminho completo da pasta ou por
+um nome explícito no formato NOME=PASTA.
+
+Uso:
+    python job_alertas.py [--dados [NOME=]PASTA ...] [--cpa-maximo R$] [--aumento-custo %]
+                          [--metas-cpa metas.json] [--webhook URL] [--a-cada MINUTOS] [--forcar]
+
+Agendamento (a cada hora), ex. no cron:
+    0 * * * * cd /caminho/do/repo && python job_alertas.py --webhook https://...
+ou sem agendador: python job_alertas.py --a-cada 60
+"""
+import argparse
+import json
+import math
+import sys
+import time
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from campanhas import alertas
+from campanhas.dados import DIRETORIO_DADOS, assinatura_arquivos, load_and_preprocess_data
+
+
+def _ler_estado(caminho):
+    if not caminho.exists():
+        return {"contas": {}}
+    return json.loads(caminho.read_text(encoding='utf-8'))
+
+
+def contas_por_pasta(entradas):
+    """{conta: pasta} a partir de entradas "PASTA" ou "NOME=PASTA". Sem nome, a conta é o caminho completo da pasta."""
+    contas = {}
+    for entrada in entradas:
+        nome, separador, pasta = entrada.partition("=")
+        if not separador:
+            nome, pasta = str(Path(entrada).resolve()), entrada
+        if nome in contas:
+            raise ValueError(f"Conta repetida em --dados: {nome}")
+        contas[nome] = pasta
+    return contas
+
+
+def carregar_contas(pastas, estado, regras, forcar=False):
+    """{conta: data} das contas a reavaliar e o novo estado de cada uma.
+
+    Uma conta é reavaliada quando a assinatura dos exports ou as `regras` diferem das
+    registradas na última execução.
+    """
+    contas = {}
+    novos_estados = {}
+    for conta, pasta in pastas.items():
+        estado_conta = {"assinatura": repr(assinatura_arquivos(pasta)), "regras": regras}
+        if not forcar and estado["contas"].get(conta) == estado_conta:
+            continue
+        data, problemas = load_and_preprocess_data(pasta)
+        for problema in problemas:
+            if problema['nivel'] == "erro":
+                print(f"[{conta}] {problema['arquivo']}: {problema['mensagem']}", file=sys.stderr)
+        contas[conta] = data
+        novos_estados[conta] = estado_conta
+    return contas, novos_estados
+
+
+def _valor_json(valor):
+    """Converte escalares NumPy para os tipos do Python; infinito/NaN (custo sem conversões) viram null.
+
+    Outros tipos seguem como estão: o que o JSON não aceita gera erro em vez de ser gravado errado.
+    """
+    if isinstance(valor, np.generic):
+        valor = valor.item()
+    if isinstance(valor, float) and not math.isfinite(valor):
+        return None
+    return valor
+
+
+def gravar_caixa_saida(df_alertas, caminho):
+    """Acrescenta os alertas ao arquivo de saída (JSON Lines) e devolve os registros gravados."""
+    gerado_em = datetime.now().isoformat(timespec='seconds')
+    registros = [
+        {**{coluna: _valor_json(valor) for coluna, valor in registro.items()}, 'Gerado_em': gerado_em}
+        for registro in df_alertas.to_dict(orient="records")
+    ]
+    # Tudo é serializado antes de abrir o arquivo: um valor inválido não deixa um lote pela metade
+    linhas = [json.dumps(registro, ensure_ascii=False, allow_nan=False) + "\n" for registro in registros]
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    with open(caminho, "a", encoding='utf-8') as arquivo:
+        arquivo.writelines(linhas)
+    return registros
+
+
+def enviar_webhook(url, registros, timeout=10):
+    """POST dos alertas como JSON ({"alertas": [...]})."""
+    corpo = json.dumps({"alertas": registros}, ensure_ascii=False, allow_nan=False).encode('utf-8')
+    requisicao = urllib.request.Request(url, data=corpo, headers={"Content-Type": "application/json"}, method="POST")
+    with urllib.request.urlopen(requisicao, timeout=timeout) as resposta:
+        return resposta.status
+
+
+def enviar_pendentes(url, registros):
+    """Envia os registros ao webhook e devolve os que continuam pendentes (todos, se o envio falhar)."""
+    if not registros:
+        return []
+    try:
+        enviar_webhook(url, registros)
+    except OSError as e:
+        print(f"Falha ao enviar {len(registros)} alerta(s) ao webhook: {e}. Nova tentativa na próxima execução.", file=sys.stderr)
+        return registros
+    return []
+
+
+def executar(args):
+    """Uma rodada do job. Devolve o número de alertas gerados."""
+    saida = Path(args.saida)
+    caminho_estado = saida / "estado.json"
+    estado = _ler_estado(caminho_estado)
+
+    metas_cpa = json.loads(Path(args.metas_cpa).read_text(encoding='utf-8')) if args.metas_cpa else None
+    regras = {"cpa_maximo": args.cpa_maximo, "aumento_custo": args.aumento_custo, "metas_cpa": metas_cpa}
+    contas, novos_estados = carregar_contas(contas_por_pasta(args.dados), estado, regras, args.forcar)
+    pendentes = estado.get("pendentes_webhook", [])
+    if not contas and not (args.webhook and pendentes):
+        print("Nenhum export novo nem mudança de regras desde a última execução.")
+        return 0
+
+    registros = []
+    if contas:
+        df_alertas = alertas.avaliar(contas, args.cpa_maximo, args.aumento_custo, metas_cpa)
+        registros = gravar_caixa_saida(df_alertas, saida / "caixa_saida.jsonl")
+        for registro in registros:
+            print(f"[{registro['Conta']}] {registro['Campanha']}: {registro['Mensagem']}")
+
+    if args.webhook:
+        # Registros de execuções anteriores que o webhook não recebeu vão junto, na ordem em que foram gerados
+        estado["pendentes_webhook"] = enviar_pendentes(args.webhook, pendentes + registros)
+
+    estado["contas"].update(novos_estados)
+    saida.mkdir(parents=True, exist_ok=True)
+    caminho_estado.write_text(json.dumps(estado, ensure_ascii=False, indent=2), encoding='utf-8')
+    print(f"{len(registros)} alerta(s) em {len(contas)} conta(s) avaliada(s).")
+    return len(registros)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dados", nargs="+", default=[str(DIRETORIO_DADOS)], help="pasta(s) de exports, uma por conta, opcionalmente como NOME=PASTA")
+    parser.add_argument("--cpa-maximo", type=float, default=alertas.CPA_MAXIMO, help="meta de CPA padrão (R$)")
+    parser.add_argument("--aumento-custo", type=float, default=alertas.AUMENTO_CUSTO, help="aumento de custo máximo (%%)")
+    parser.add_argument("--metas-cpa", help='JSON com metas por campanha, ex.: {"Nome da campanha": 12.5}')
+    parser.add_argument("--saida", default=str(DIRETORIO_DADOS / "alertas"))
+    parser.add_argument("--webhook", help="URL que recebe os alertas por POST")
+    parser.add_argument("--a-cada", type=float, help="repete a cada N minutos em vez de rodar uma vez")
+    parser.add_argument("--forcar", action="store_true", help="reavalia mesmo sem exports novos")
+    args = parser.parse_args()
+    try:
+        contas_por_pasta(args.dados)
+    except ValueError as e:
+        parser.error(str(e))
+
+    executar(args)
+    args.forcar = False
+    while args.a_cada:
+        time.sleep(args.a_cada * 60)
+        executar(args)
+
+
+if __name__ == "__main__":
+    main()
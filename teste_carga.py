@@ -0,0 +1,276 @@
+"""Teste de carga do dashboard com várias sessões simultâneas.
+
+Sobe o app com `streamlit run` (headless, em uma porta livre) e simula N analistas
+abrindo a aba de palavras-chave ao mesmo tempo e movendo o slider de Top N. Cada
+sessão é um cliente WebSocket falando o mesmo protocolo do navegador, então todas
+compartilham os caches e o Runtime do servidor como os usuários de um container.
+
+Os dados são uma cópia dos exports com o arquivo de palavras-chave ampliado
+(--palavras-chave linhas), gravada em uma pasta temporária indicada por CAMPANHAS_DADOS.
+
+Mede:
+
+- abertura: primeira execução de cada sessão (uma sessão de aquecimento preenche os caches antes);
+- reexecucao: cada movimento do slider, do envio até o fim da execução do script,
+  em percentis (p50, p95, p99) e máximo;
+- memoria_por_sessao: aumento da memória residente do servidor dividido pelo número
+  de sessões, medido com as sessões ainda conectadas.
+
+Requer as dependências de desenvolvimento (pip install -r requirements-dev.txt).
+
+Uso:
+    python teste_carga.py [--sessoes N] [--movimentos M] [--palavras-chave LINHAS] [--app app.py]
+
+Sai com código 1 se alguma execução falhar (exceção no script ou no servidor) ou se o
+p95 das reexecuções passar de --meta-p95 (segundos).
+"""
+import argparse
+import asyncio
+import contextlib
+import csv
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.parse
+import urllib.request
+from pathlib import Path
+
+import numpy as np
+import psutil
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+RAIZ = Path(__file__).resolve().parent
+ABA = "🔑 Palavras-chave"
+
+
+# --- Exports Sintéticos ---
+def gerar_exports(destino, linhas_palavras_chave):
+    """Copia os exports para `destino`, ampliando o de palavras-chave para o número de linhas pedido.
+
+    As linhas novas repetem as originais com o texto da palavra-chave numerado, mantendo
+    o formato do Google Ads ("R$ 1.234,56", "3,82%") para passar pela mesma limpeza.
+    """
+    from campanhas.dados import ARQUIVOS
+
+    for nome in ARQUIVOS.values():
+        shutil.copy2(RAIZ / nome, destino / nome)
+
+    nome = ARQUIVOS["Palavras_Chave"]
+    with open(RAIZ / nome, encoding='utf-8', newline='') as arquivo:
+        leitor = csv.reader(arquivo)
+        cabecalho = next(leitor)
+        originais = list(leitor)
+
+    coluna_palavra = cabecalho.index('Palavra-chave da rede de pesquisa')
+    with open(destino / nome, "w", encoding='utf-8', newline='') as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(cabecalho)
+        for i in range(linhas_palavras_chave):
+            linha = list(originais[i % len(originais)])
+            if i >= len(originais):
+                linha[coluna_palavra] = f"{linha[coluna_palavra]} {i // len(originais)}"
+            escritor.writerow(linha)
+
+
+# --- Servidor ---
+def _porta_livre():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@contextlib.contextmanager
+def servidor(app, dados, log, timeout=60):
+    """Roda `streamlit run app` com CAMPANHAS_DADOS=dados e devolve (processo, porta) quando o servidor responde."""
+    porta = _porta_livre()
+    comando = [
+        sys.executable, "-m", "streamlit", "run", app,
+        "--server.headless", "true", "--server.port", str(porta),
+        "--browser.gatherUsageStats", "false",
+    ]
+    processo = subprocess.Popen(comando, cwd=RAIZ, env={**os.environ, "CAMPANHAS_DADOS": str(dados)}, stdout=log, stderr=subprocess.STDOUT)
+    try:
+        limite = time.monotonic() + timeout
+        while True:
+            if processo.poll() is not None:
+                raise RuntimeError(f"o servidor terminou com código {processo.returncode}")
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{porta}/_stcore/health", timeout=1):
+                    break
+            except OSError:
+                if time.monotonic() > limite:
+                    raise RuntimeError("o servidor não respondeu a tempo")
+                time.sleep(0.2)
+        yield processo, porta
+    finally:
+        processo.terminate()
+        try:
+            processo.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            processo.kill()
+
+
+def memoria_mb(processo):
+    """Memória residente atual do servidor em MB.
+
+    O pico (ru_maxrss) não serve: a diferença entre dois picos não é a memória que
+    as sessões abertas ocupam.
+    """
+    return psutil.Process(processo.pid).memory_info().rss / 2**20
+
+
+# --- Sessões ---
+async def _executar(conexao, widgets=(), timeout=300):
+    """Pede uma execução do script (como o navegador faz ao abrir a página ou mover um widget) e espera o fim.
+
+    Devolve (duração, elementos exibidos). Falha se o script levantar exceção ou não
+    terminar normalmente.
+    """
+    mensagem = BackMsg()
+    mensagem.rerun_script.query_string = urllib.parse.urlencode({"secao": ABA})
+    mensagem.rerun_script.widget_states.widgets.extend(widgets)
+
+    inicio = time.perf_counter()
+    await conexao.send(mensagem.SerializeToString())
+    elementos = []
+    async with asyncio.timeout(timeout):
+        while True:
+            resposta = ForwardMsg()
+            resposta.ParseFromString(await conexao.recv())
+            tipo = resposta.WhichOneof("type")
+            if tipo == "delta" and resposta.delta.WhichOneof("type") == "new_element":
+                elementos.append(resposta.delta.new_element)
+            elif tipo == "script_finished":
+                break
+    duracao = time.perf_counter() - inicio
+
+    excecoes = [e.exception.message for e in elementos if e.WhichOneof("type") == "exception"]
+    if excecoes:
+        raise RuntimeError(f"exceção no script: {excecoes}")
+    if resposta.script_finished != ForwardMsg.FINISHED_SUCCESSFULLY:
+        raise RuntimeError(f"execução terminou com status {ForwardMsg.ScriptFinishedStatus.Name(resposta.script_finished)}")
+    return duracao, elementos
+
+
+async def _sessao(url, movimentos, semente, largada, conexoes):
+    """Uma sessão: abre a aba de palavras-chave e move o slider. Devolve (abertura, latências).
+
+    A conexão fica aberta em `conexoes` até o fim da medição, como uma aba do navegador.
+    """
+    aleatorio = random.Random(semente)
+    conexao = await conexoes.enter_async_context(websockets.connect(url, subprotocols=["streamlit"], max_size=None))
+    await largada.wait()
+
+    abertura, elementos = await _executar(conexao)
+    sliders = [e.slider for e in elementos if e.WhichOneof("type") == "slider"]
+    if not sliders:
+        raise RuntimeError(f"a aba {ABA} não exibiu o slider de Top N")
+    slider = sliders[0]
+
+    latencias = []
+    for _ in range(movimentos):
+        estado = WidgetState(id=slider.id)
+        estado.double_array_value.data.append(aleatorio.randint(int(slider.min), int(slider.max)))
+        latencia, elementos = await _executar(conexao, [estado])
+        if not any(e.WhichOneof("type") == "slider" and e.slider.id == slider.id for e in elementos):
+            raise RuntimeError("a reexecução não exibiu o slider movido")
+        latencias.append(latencia)
+    return abertura, latencias
+
+
+async def _medir(url, processo, sessoes, movimentos):
+    async with contextlib.AsyncExitStack() as conexoes:
+        aquecimento, _ = await _sessao(url, 1, -1, asyncio.Barrier(1), conexoes)
+    memoria_base = memoria_mb(processo)
+
+    largada = asyncio.Barrier(sessoes)
+    async with contextlib.AsyncExitStack() as conexoes:
+        inicio = time.perf_counter()
+        resultados = await asyncio.gather(
+            *[_sessao(url, movimentos, i, largada, conexoes) for i in range(sessoes)],
+            return_exceptions=True,
+        )
+        duracao = time.perf_counter() - inicio
+        memoria_final = memoria_mb(processo)
+    return aquecimento, resultados, duracao, memoria_base, memoria_final
+
+
+def medir(app, dados, sessoes, movimentos, log):
+    """Aquece os caches com uma sessão e então roda `sessoes` sessões simultâneas no mesmo servidor.
+
+    Devolve (medidas, falhas); `falhas` lista as sessões que levantaram erro e os
+    tracebacks que o servidor registrou no log.
+    """
+    with servidor(app, dados, log) as (processo, porta):
+        url = f"ws://127.0.0.1:{porta}/_stcore/stream"
+        aquecimento, resultados, duracao, memoria_base, memoria_final = asyncio.run(_medir(url, processo, sessoes, movimentos))
+
+    falhas = [f"sessão {i}: {r}" for i, r in enumerate(resultados) if isinstance(r, BaseException)]
+    log.seek(0)
+    if "Traceback" in log.read():
+        falhas.append(f"o servidor registrou exceções (log em {log.name})")
+    concluidas = [r for r in resultados if not isinstance(r, BaseException)]
+    if not concluidas:
+        return None, falhas
+
+    latencias = np.array([latencia for _, sessao in concluidas for latencia in sessao])
+    aberturas = np.array([abertura for abertura, _ in concluidas])
+    medidas = {
+        "aquecimento": aquecimento,
+        "abertura_p50": float(np.percentile(aberturas, 50)),
+        "abertura_max": float(aberturas.max()),
+        "reexecucao_p50": float(np.percentile(latencias, 50)),
+        "reexecucao_p95": float(np.percentile(latencias, 95)),
+        "reexecucao_p99": float(np.percentile(latencias, 99)),
+        "reexecucao_max": float(latencias.max()),
+        "reexecucoes_por_segundo": len(latencias) / duracao,
+        "memoria_base_mb": memoria_base,
+        "memoria_por_sessao_mb": (memoria_final - memoria_base) / sessoes,
+    }
+    return medidas, falhas
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessoes", type=int, default=8)
+    parser.add_argument("--movimentos", type=int, default=10, help="movimentos do slider por sessão")
+    parser.add_argument("--palavras-chave", type=int, default=20000, help="linhas do export sintético de palavras-chave")
+    parser.add_argument("--app", default="app.py")
+    parser.add_argument("--meta-p95", type=float, default=2.0, help="segundos")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="campanhas_carga_") as pasta:
+        gerar_exports(Path(pasta), args.palavras_chave)
+        # O log fica fora da pasta temporária para poder ser consultado quando há falhas
+        with tempfile.NamedTemporaryFile("w+", prefix="campanhas_carga_", suffix=".log", delete=False, encoding='utf-8') as log:
+            try:
+                medidas, falhas = medir(str(RAIZ / args.app), pasta, args.sessoes, args.movimentos, log)
+            except RuntimeError as e:
+                # Servidor que não sobe ou sessão de aquecimento que falha: não há o que medir
+                medidas, falhas = None, [f"{e} (log em {log.name})"]
+
+    print(f"{args.sessoes} sessões x {args.movimentos} movimentos, {args.palavras_chave} palavras-chave ({args.app})")
+    for nome, valor in (medidas or {}).items():
+        unidade = "MB" if nome.endswith("_mb") else ("/s" if nome.endswith("por_segundo") else "s")
+        print(f"{nome:<24} {valor:9.3f} {unidade}")
+    for falha in falhas:
+        print(f"FALHA {falha}")
+
+    acima_da_meta = medidas is not None and medidas["reexecucao_p95"] > args.meta_p95
+    if acima_da_meta:
+        print(f"p95 das reexecuções acima da meta ({args.meta_p95:.1f}s)")
+    if not falhas:
+        Path(log.name).unlink(missing_ok=True)
+    sys.exit(1 if falhas or acima_da_meta else 0)
+
+
+if __name__ == "__main__":
+    main()